@@ -0,0 +1,191 @@
+"""Cliente HTTP asíncrono para consumir la API de tasas de OptiCred."""
+
+import asyncio
+import atexit
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import orjson
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = "http://localhost:8000"
+
+
+class OptiCredAPIClient:
+    """Cliente asíncrono contra la API de OptiCred.
+
+    La sesión aiohttp se crea de forma perezosa y se reutiliza durante
+    toda la vida del cliente: así cada petición paga como máximo un RTT
+    (keep-alive + pool de conexiones) en lugar de un handshake TCP+TLS
+    completo por llamada.
+    """
+
+    def __init__(self, base_url: str = API_BASE_URL):
+        self.base_url = base_url.rstrip("/")
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Devuelve la sesión compartida, creándola solo la primera vez."""
+        if self._session is None or self._session.closed:
+            # Todas las llamadas van al mismo origen: mantener las
+            # conexiones vivas y con cupo por host amortiza el TLS sobre
+            # ráfagas tipo asyncio.gather(health, tasas, bancos).
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                force_close=False,
+            )
+            timeout = aiohttp.ClientTimeout(total=30)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def close_session(self) -> None:
+        """Cierra la sesión compartida (llamar solo al apagar la app)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Hace un GET contra la API y devuelve el cuerpo JSON parseado."""
+        session = self._get_session()
+        url = f"{self.base_url}{endpoint}"
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            # orjson parsea los payloads numéricos grandes varias veces
+            # más rápido que el json de la stdlib.
+            return await response.json(loads=orjson.loads)
+
+    def _json_to_dataframe(self, json_data: Dict[str, Any]) -> pd.DataFrame:
+        """Construye un DataFrame directamente desde el dict orient='split'.
+
+        `_make_request` ya devuelve el JSON parseado; pasar por
+        `pd.read_json` lo re-serializaría solo para volver a parsearlo.
+        """
+        return pd.DataFrame(
+            json_data["data"],
+            columns=json_data["columns"],
+            index=json_data["index"],
+        )
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Verifica que la API esté disponible."""
+        return await self._make_request("/health")
+
+    async def get_tasas_activas(self) -> pd.DataFrame:
+        """Tabla completa de tasas activas publicada por la SBS."""
+        json_data = await self._make_request("/tasas/activas")
+        return self._json_to_dataframe(json_data)
+
+    async def get_tasas_activas_arrow(self) -> pd.DataFrame:
+        """Tabla de tasas activas por transporte Arrow IPC (Feather+LZ4).
+
+        Los floats viajan como buffers columnares binarios: sin pasar por
+        texto JSON ni inferencia de tipos al leer.
+        """
+        from io import BytesIO
+
+        import pyarrow.feather as feather
+
+        session = self._get_session()
+        url = f"{self.base_url}/tasas/activas"
+        headers = {"Accept": "application/vnd.apache.arrow.stream"}
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            body = await response.read()
+        tasas = feather.read_feather(BytesIO(body))
+        return tasas.set_index(tasas.columns[0])
+
+    async def get_tasas_activas_stream(self) -> pd.DataFrame:
+        """Tabla de tasas activas consumida en streaming (NDJSON).
+
+        Parsea fila a fila mientras el servidor sigue emitiendo, evitando
+        materializar el cuerpo completo antes del primer byte útil.
+        """
+        session = self._get_session()
+        url = f"{self.base_url}/tasas/activas.ndjson"
+        columnas = None
+        indices = []
+        filas = []
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                registro = orjson.loads(line)
+                if columnas is None:
+                    columnas = registro["columns"]
+                    continue
+                indices.append(registro["index"])
+                filas.append(registro["data"])
+        return pd.DataFrame(filas, columns=columnas, index=indices)
+
+    async def get_tasas_por_tipo(self, tipo_credito: str) -> pd.DataFrame:
+        """Sub-tabla de tasas (filas = productos, columnas = bancos).
+
+        El endpoint responde el mismo dict orient='split' bidimensional
+        que /tasas/activas, solo que acotado a la categoría.
+        """
+        json_data = await self._make_request(f"/tasas/tipo/{tipo_credito}")
+        return self._json_to_dataframe(json_data)
+
+    async def get_bancos(self) -> List[str]:
+        """Lista de bancos presentes en la tabla de la SBS."""
+        return await self._make_request("/bancos/")
+
+    async def get_tea(self, banco: str, tipo_credito: str, credito: str) -> Optional[float]:
+        """TEA de un banco para un tipo de crédito específico."""
+        return await self._make_request(f"/tea/{banco}/{tipo_credito}/{credito}")
+
+    async def get_promedio(self, tipo_credito: str, credito: str) -> Optional[float]:
+        """Tasa promedio del mercado para un tipo de crédito."""
+        return await self._make_request(f"/tasas/promedio/{tipo_credito}/{credito}")
+
+
+# Cliente compartido a nivel de módulo: las funciones de conveniencia
+# reutilizan la misma sesión HTTP en lugar de abrir y cerrar una por llamada.
+_client: Optional[OptiCredAPIClient] = None
+
+
+def _get_client() -> OptiCredAPIClient:
+    global _client
+    if _client is None:
+        _client = OptiCredAPIClient()
+        atexit.register(_shutdown_client)
+    return _client
+
+
+def _shutdown_client() -> None:
+    if _client is not None:
+        try:
+            asyncio.run(_client.close_session())
+        except RuntimeError:
+            # Ya hay un loop corriendo durante el apagado; aiohttp limpia solo.
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Funciones de conveniencia (API pública del módulo)
+# ---------------------------------------------------------------------------
+
+async def get_tasas_activas() -> pd.DataFrame:
+    """Obtiene la tabla completa de tasas activas."""
+    return await _get_client().get_tasas_activas()
+
+
+async def get_tea(banco: str, tipo_credito: str, credito: str) -> Optional[float]:
+    """Obtiene la TEA de un banco para un crédito específico."""
+    return await _get_client().get_tea(banco, tipo_credito, credito)
+
+
+async def get_promedio(tipo_credito: str, credito: str) -> Optional[float]:
+    """Obtiene la tasa promedio del mercado."""
+    return await _get_client().get_promedio(tipo_credito, credito)
+
+
+async def get_bancos() -> List[str]:
+    """Obtiene la lista de bancos disponibles."""
+    return await _get_client().get_bancos()
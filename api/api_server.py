@@ -0,0 +1,291 @@
+"""API REST de OptiCred (FastAPI) sobre el scraper de tasas de la SBS."""
+
+import asyncio
+import functools
+import logging
+import platform
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import orjson
+import pyarrow.feather as feather
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from modules.sbs_scraper import Columna_Banco, Slice_Tipo_Credito, opciones
+
+logger = logging.getLogger(__name__)
+
+# uvloop reduce a la mitad el overhead por petición del loop por defecto;
+# es un reemplazo directo, sin cambios en las corrutinas (no hay build
+# para Windows).
+if platform.system() != "Windows":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:  # pragma: no cover - uvloop es opcional
+        pass
+
+app = FastAPI(
+    title="OptiCred API",
+    description="Tasas activas de créditos publicadas por la SBS",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_scraper():
+    """Devuelve la instancia única del scraper.
+
+    Construirla es barato (solo guarda la URL); la carga de Playwright
+    la difiere el propio scraper hasta el primer `_fetch_html`.
+    """
+    from modules.sbs_scraper import SBSScraper
+
+    return SBSScraper()
+
+
+# Caché TTL en proceso: la tabla de la SBS cambia a lo sumo una vez al día,
+# así que los hits repetidos no deben relanzar un scrape de varios segundos.
+CACHE_TTL = 3600  # segundos
+
+cache: Dict[str, Tuple[float, Any]] = {}
+
+# Registro de scrapes en vuelo: las peticiones concurrentes sobre la misma
+# clave esperan el Future del primer scrape en vez de lanzar uno cada una.
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+# Centinela de fallo de caché: None es un resultado legítimo del scraper
+# (banco sin tasa publicada) y también debe cachearse durante el TTL.
+_SIN_VALOR = object()
+
+
+def get_cache(key: str, ttl: float = CACHE_TTL) -> Any:
+    """Devuelve el valor cacheado si sigue vigente, o `_SIN_VALOR`."""
+    entry = cache.get(key)
+    if entry is None:
+        return _SIN_VALOR
+    ts, value = entry
+    if time.monotonic() - ts >= ttl:
+        return _SIN_VALOR
+    return value
+
+
+def set_cache(key: str, value: Any, ttl: float = CACHE_TTL) -> None:
+    """Guarda un valor en el caché con su marca de tiempo."""
+    cache[key] = (time.monotonic(), value)
+
+
+async def cached(key: str, factory: Callable[[], Awaitable[Any]], ttl: float = CACHE_TTL) -> Any:
+    """Resuelve `factory()` una sola vez por TTL, con single-flight.
+
+    Sobre caché frío, la primera petición registra un Future por clave y
+    ejecuta el scrape; las demás esperan ese mismo Future. El registro se
+    limpia al terminar, así N peticiones simultáneas cuestan 1 scrape y
+    no queda estado por clave una vez resuelto.
+    """
+    value = get_cache(key, ttl)
+    if value is not _SIN_VALOR:
+        return value
+
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        value = await factory()
+        set_cache(key, value, ttl)
+        fut.set_result(value)
+    except BaseException as exc:
+        fut.set_exception(exc)
+        raise
+    finally:
+        _inflight.pop(key, None)
+    return value
+
+
+# Tablas de despacho estáticas construidas una sola vez al importar: los
+# parsers quedan en un solo dict.get en lugar de indexar el enum con
+# try/except por petición.
+_SLICE_MAP = {e.name: e for e in Slice_Tipo_Credito}
+_BANCO_MAP = {e.name: e for e in Columna_Banco}
+_CREDITO_MAP = {cls.__name__.upper(): cls for cls in opciones}
+
+
+@functools.lru_cache(maxsize=256)
+def parse_slice_tipo_credito(tipo_credito: str) -> Optional[Slice_Tipo_Credito]:
+    """Convierte un nombre de categoría en su enum, o None si no existe."""
+    return _SLICE_MAP.get(tipo_credito.upper())
+
+
+@functools.lru_cache(maxsize=256)
+def parse_columna_banco(banco: str) -> Optional[Columna_Banco]:
+    """Convierte un nombre de banco en su enum de columna, o None."""
+    return _BANCO_MAP.get(banco.upper())
+
+
+@functools.lru_cache(maxsize=256)
+def parse_credito(tipo_credito: str, credito: str):
+    """Resuelve el enum de producto dentro de la clase de crédito indicada."""
+    cls = _CREDITO_MAP.get(tipo_credito.upper())
+    if cls is None:
+        return None
+    try:
+        return cls[credito.upper()]
+    except KeyError:
+        return None
+
+
+@app.get("/health")
+async def health():
+    """Estado de la API."""
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        "cache_entries": len(cache),  # entradas vigentes o no, solo diagnóstico
+    }
+
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _split_payload(tasas) -> ORJSONResponse:
+    """Respuesta orient='split' sin convertir la matriz numérica a listas.
+
+    orjson serializa el ndarray directamente (OPT_SERIALIZE_NUMPY), así
+    que no hace falta el to_dict() que materializa lista-de-listas en
+    Python antes de codificar. La respuesta se construye aquí mismo: si
+    la ruta devolviera el dict, el pipeline de validación de FastAPI
+    intentaría codificar el ndarray antes de llegar a ORJSONResponse y
+    respondería 500.
+    """
+    valores = tasas.to_numpy()
+    if valores.dtype == np.object_:
+        # Celdas mixtas (la SBS marca huecos con "-"): orjson no
+        # serializa ndarrays de objetos, así que se materializan listas.
+        data: Any = valores.tolist()
+    else:
+        # to_numpy() de un frame multi-columna devuelve la vista
+        # transpuesta (F-contigua) del block manager y orjson exige
+        # C-contiguo; la copia compacta es más barata que tolist().
+        data = np.ascontiguousarray(valores)
+    return ORJSONResponse(
+        {
+            "columns": tasas.columns.tolist(),
+            "index": tasas.index.tolist(),
+            "data": data,
+        }
+    )
+
+
+def _arrow_response(tasas) -> Response:
+    """Serializa un DataFrame como Arrow IPC (Feather + LZ4).
+
+    Evita el ida y vuelta float -> texto -> float de JSON: el cliente
+    recibe los buffers columnares tal cual, sin inferencia de esquema.
+    """
+    import io
+
+    sink = io.BytesIO()
+    feather.write_feather(tasas.reset_index(), sink, compression="lz4")
+    return Response(content=sink.getvalue(), media_type=ARROW_MEDIA_TYPE)
+
+
+@app.get("/tasas/activas")
+async def get_tasas_activas(request: Request):
+    """Tabla completa de tasas activas.
+
+    Con ``Accept: application/vnd.apache.arrow.stream`` responde Arrow
+    IPC; si no, el dict orient='split' de siempre (compatibilidad).
+    """
+    tasas = await cached("tasas_activas", get_scraper().get_tasas_activas)
+    if ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        return _arrow_response(tasas)
+    return _split_payload(tasas)
+
+
+@app.get("/tasas/activas.ndjson")
+async def get_tasas_activas_ndjson():
+    """Tabla de tasas activas como NDJSON: una fila por línea.
+
+    Permite al cliente empezar a parsear mientras el servidor sigue
+    emitiendo, sin materializar todo el cuerpo en memoria en ninguno de
+    los dos lados.
+    """
+    tasas = await cached("tasas_activas", get_scraper().get_tasas_activas)
+    columnas = [str(c) for c in tasas.columns]
+
+    def row_generator():
+        yield orjson.dumps({"columns": columnas}) + b"\n"
+        for idx, fila in zip(tasas.index, tasas.to_numpy()):
+            yield orjson.dumps(
+                {"index": str(idx), "data": fila.tolist()}
+            ) + b"\n"
+
+    return StreamingResponse(row_generator(), media_type="application/x-ndjson")
+
+
+@app.get("/bancos/")
+async def get_bancos():
+    """Lista de bancos presentes en la tabla de la SBS."""
+    return await cached("bancos", get_scraper().get_bancos)
+
+
+@app.get("/tasas/tipo/{tipo_credito}")
+async def get_tasas_por_tipo(tipo_credito: str, request: Request):
+    """Sub-tabla de tasas para una categoría principal."""
+    slice_tipo = parse_slice_tipo_credito(tipo_credito)
+    if slice_tipo is None:
+        raise HTTPException(status_code=404, detail=f"Tipo de crédito no válido: {tipo_credito}")
+    tasas = await cached(
+        f"tasas_tipo:{slice_tipo.name}",
+        lambda: get_scraper().get_tasas_por_tipo(slice_tipo),
+    )
+    if ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        return _arrow_response(tasas)
+    return _split_payload(tasas)
+
+
+@app.get("/tea/{banco}/{tipo_credito}/{credito}")
+async def get_tea(banco: str, tipo_credito: str, credito: str):
+    """TEA de un banco para un producto de crédito específico."""
+    columna = parse_columna_banco(banco)
+    if columna is None:
+        raise HTTPException(status_code=404, detail=f"Banco no válido: {banco}")
+    producto = parse_credito(tipo_credito, credito)
+    if producto is None:
+        raise HTTPException(status_code=404, detail=f"Crédito no válido: {tipo_credito}/{credito}")
+    tea = await cached(
+        f"tea:{columna.name}:{producto.__class__.__name__}:{producto.name}",
+        lambda: get_scraper().get_tea(columna, producto),
+    )
+    if tea is None:
+        raise HTTPException(status_code=404, detail="El banco no publica tasa para ese crédito")
+    return tea
+
+
+@app.get("/tasas/promedio/{tipo_credito}/{credito}")
+async def get_promedio(tipo_credito: str, credito: str):
+    """Tasa promedio del mercado para un producto de crédito."""
+    producto = parse_credito(tipo_credito, credito)
+    if producto is None:
+        raise HTTPException(status_code=404, detail=f"Crédito no válido: {tipo_credito}/{credito}")
+    promedio = await cached(
+        f"promedio:{producto.__class__.__name__}:{producto.name}",
+        lambda: get_scraper().get_promedio(producto),
+    )
+    if promedio is None:
+        raise HTTPException(status_code=404, detail="Sin promedio publicado para ese crédito")
+    return promedio
+
+
+if __name__ == "__main__":
+    uvicorn.run("api.api_server:app", host="0.0.0.0", port=8000, reload=False)
@@ -0,0 +1,147 @@
+"""OptiCred — Plataforma web para comparar, evaluar y optimizar créditos."""
+
+import asyncio
+import atexit
+import platform
+import threading
+from typing import Optional
+
+import streamlit as st
+
+if platform.system() != "Windows":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+from api.api_client import OptiCredAPIClient
+from modules.calculadora import mostrar_calculadora_creditos
+
+st.set_page_config(
+    page_title="OptiCred",
+    page_icon="💳",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+
+# Loop de eventos persistente en un hilo de fondo, igual que en
+# modules.api_tasas: la sesión aiohttp compartida queda ligada a un único
+# loop vivo. Con asyncio.run por llamada, cada llamada cerraba su loop y
+# la siguiente reutilizaba una sesión huérfana ("Event loop is closed").
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Arranca (una sola vez) el loop de fondo y lo devuelve."""
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="opticred-app-loop",
+                    daemon=True,
+                ).start()
+                _LOOP = loop
+    return _LOOP
+
+
+def _ejecutar(coro):
+    """Ejecuta una corrutina en el loop de fondo y espera su resultado."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout=60)
+
+
+def _cerrar_cliente(client: OptiCredAPIClient) -> None:
+    """Cierra la sesión compartida sobre su propio loop al apagar la app."""
+    try:
+        _ejecutar(client.close_session())
+    except Exception:
+        # El intérprete ya está apagándose; aiohttp limpia solo.
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def get_api_client() -> OptiCredAPIClient:
+    """Devuelve el cliente HTTP compartido durante toda la vida de la app.
+
+    `st.cache_resource` garantiza una sola instancia por proceso, así la
+    sesión aiohttp (y su pool de conexiones keep-alive) se reutiliza en
+    todos los reruns en lugar de pagar un handshake TCP+TLS por llamada.
+    """
+    client = OptiCredAPIClient()
+    atexit.register(_cerrar_cliente, client)
+    return client
+
+
+async def _fetch_basico(client: OptiCredAPIClient):
+    """Trae los datos básicos para la prueba de conexión.
+
+    Los tres endpoints son independientes, así que se lanzan en paralelo:
+    la latencia total pasa de sum(t_i) a max(t_i) sobre el mismo pool de
+    conexiones keep-alive.
+    """
+    health, tasas, bancos = await asyncio.gather(
+        client.health_check(),
+        client.get_tasas_activas(),
+        client.get_bancos(),
+    )
+    return health, tasas, bancos
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_basico():
+    """Datos básicos cacheados entre reruns.
+
+    Streamlit re-ejecuta todo el script en cada interacción; sin esto,
+    cada widget tocado volvía a golpear la API y a reconstruir los
+    DataFrames aunque el payload no hubiera cambiado.
+    """
+    return _ejecutar(_fetch_basico(get_api_client()))
+
+
+def mostrar_prueba_conexion() -> None:
+    """Sección de diagnóstico: verifica la conexión contra la API."""
+    st.header("🔌 Prueba de Conexión")
+    st.caption("Verifica que la API de tasas esté respondiendo correctamente.")
+
+    if st.button("Probar conexión"):
+        with st.spinner("Consultando la API..."):
+            try:
+                health, tasas, bancos = load_basico()
+            except Exception as exc:
+                st.error(f"No se pudo conectar con la API: {exc}")
+                return
+
+        st.success(f"API disponible — estado: {health.get('status', 'desconocido')}")
+        st.subheader("Bancos disponibles")
+        st.write(", ".join(bancos) if bancos else "Sin datos")
+        st.subheader("Tasas activas (SBS)")
+        st.dataframe(tasas, use_container_width=True)
+
+
+def main() -> None:
+    st.sidebar.title("OptiCred")
+    seccion = st.sidebar.radio(
+        "Navegación",
+        ["🏠 Inicio", "🧮 Calculadora", "🔌 Prueba de Conexión"],
+    )
+
+    if seccion == "🏠 Inicio":
+        st.title("💳 OptiCred")
+        st.markdown(
+            "Plataforma web que permite **comparar, evaluar y optimizar créditos** "
+            "de manera rápida y precisa, con tasas reales publicadas por la SBS."
+        )
+    elif seccion == "🧮 Calculadora":
+        mostrar_calculadora_creditos()
+    elif seccion == "🔌 Prueba de Conexión":
+        mostrar_prueba_conexion()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Cálculos financieros de OptiCred: cuotas, tablas de amortización y TCEA."""
+
+import functools
+import logging
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba es opcional
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback sin JIT cuando numba no está instalado."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+logger = logging.getLogger(__name__)
+
+
+def calcular_tem(tea: float) -> float:
+    """Convierte una TEA (en %) a tasa efectiva mensual (fracción)."""
+    return (1 + tea / 100) ** (1 / 12) - 1
+
+
+@functools.lru_cache(maxsize=512)
+def calcular_cuota_francesa(monto: float, tea: float, plazo: int) -> float:
+    """Cuota fija mensual del sistema francés."""
+    tem = calcular_tem(tea)
+    if tem == 0:
+        return monto / plazo
+    return monto * tem / (1 - (1 + tem) ** -plazo)
+
+
+def _construir_tabla(
+    k: np.ndarray,
+    saldo_inicial: np.ndarray,
+    cuota: np.ndarray,
+    interes: np.ndarray,
+    amortizacion: np.ndarray,
+    saldo_final: np.ndarray,
+) -> pd.DataFrame:
+    """Redondea las columnas y arma el DataFrame final (común a ambos sistemas)."""
+    return pd.DataFrame(
+        {
+            "mes": k,
+            "saldo_inicial": np.round(saldo_inicial, 2),
+            "cuota": np.round(cuota, 2),
+            "interes": np.round(interes, 2),
+            "amortizacion": np.round(amortizacion, 2),
+            "saldo_final": np.round(saldo_final, 2),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _columnas_francesa(monto: float, tea: float, plazo: int) -> tuple:
+    """Columnas (ya redondeadas) del sistema francés, memoizadas.
+
+    Se cachea la tupla de ndarrays y no el DataFrame: los consumidores
+    mutan sus tablas (agregan columnas acumuladas, formatean), así que
+    cada llamada materializa un DataFrame fresco sobre estos buffers.
+    """
+    tem = calcular_tem(tea)
+    cuota = calcular_cuota_francesa(monto, tea, plazo)
+
+    k = np.arange(1, plazo + 1)
+    factor_prev = (1 + tem) ** (k - 1)
+    if tem == 0:
+        saldo_inicial = monto - (k - 1) * cuota
+    else:
+        saldo_inicial = monto * factor_prev - cuota * (factor_prev - 1) / tem
+    interes = saldo_inicial * tem
+    amortizacion = cuota - interes
+    saldo_final = np.maximum(0.0, saldo_inicial - amortizacion)
+    return (k, saldo_inicial, np.full(plazo, cuota), interes, amortizacion, saldo_final)
+
+
+def generar_tabla_francesa(monto: float, tea: float, plazo: int) -> pd.DataFrame:
+    """Tabla de amortización del sistema francés (cuota fija).
+
+    La recurrencia tiene forma cerrada
+    ``saldo_k = monto*(1+tem)^k - cuota*((1+tem)^k - 1)/tem``,
+    así que toda la tabla se calcula con operaciones NumPy vectorizadas;
+    para entradas repetidas las columnas salen de la caché LRU.
+    """
+    return _construir_tabla(*_columnas_francesa(monto, tea, plazo))
+
+
+@functools.lru_cache(maxsize=512)
+def _columnas_alemana(monto: float, tea: float, plazo: int) -> tuple:
+    """Columnas del sistema alemán, memoizadas (ver `_columnas_francesa`)."""
+    tem = calcular_tem(tea)
+    amortizacion_fija = monto / plazo
+
+    k = np.arange(1, plazo + 1)
+    saldo_inicial = monto - (k - 1) * amortizacion_fija
+    interes = saldo_inicial * tem
+    cuota = amortizacion_fija + interes
+    saldo_final = np.maximum(0.0, saldo_inicial - amortizacion_fija)
+    return (k, saldo_inicial, cuota, interes, np.full(plazo, amortizacion_fija), saldo_final)
+
+
+def generar_tabla_alemana(monto: float, tea: float, plazo: int) -> pd.DataFrame:
+    """Tabla de amortización del sistema alemán (amortización fija).
+
+    El saldo decrece linealmente (``saldo_k = monto - (k-1)*amortizacion``);
+    las columnas memoizadas se materializan en un DataFrame fresco.
+    """
+    return _construir_tabla(*_columnas_alemana(monto, tea, plazo))
+
+
+def calcular_totales(tabla: pd.DataFrame) -> Dict[str, float]:
+    """Totales pagados sobre una tabla de amortización."""
+    return {
+        "total_pagado": float(tabla["cuota"].sum()),
+        "total_intereses": float(tabla["interes"].sum()),
+        "total_amortizado": float(tabla["amortizacion"].sum()),
+    }
+
+
+@njit(cache=True)
+def _totales_nb(monto: float, tem: float, plazo: int) -> Tuple[float, float, float, float]:
+    """Totales (pagado, intereses) de ambos sistemas en un solo kernel JIT.
+
+    Devuelve ``(pagado_fr, intereses_fr, pagado_al, intereses_al)`` sin
+    construir DataFrames intermedios: solo aritmética escalar compilada.
+    """
+    if tem == 0.0:
+        cuota = monto / plazo
+    else:
+        cuota = monto * tem / (1 - (1 + tem) ** -plazo)
+    pagado_fr = cuota * plazo
+    intereses_fr = pagado_fr - monto
+
+    amortizacion = monto / plazo
+    intereses_al = 0.0
+    saldo = monto
+    for _ in range(plazo):
+        intereses_al += saldo * tem
+        saldo -= amortizacion
+    pagado_al = monto + intereses_al
+    return pagado_fr, intereses_fr, pagado_al, intereses_al
+
+
+@njit(cache=True, parallel=True)
+def _comparar_batch_nb(montos: np.ndarray, tems: np.ndarray, plazos: np.ndarray) -> np.ndarray:
+    """Barrido paralelo de escenarios: matriz (n, 4) con los totales."""
+    n = montos.size
+    salida = np.empty((n, 4))
+    for i in prange(n):
+        fr_p, fr_i, al_p, al_i = _totales_nb(montos[i], tems[i], int(plazos[i]))
+        salida[i, 0] = fr_p
+        salida[i, 1] = fr_i
+        salida[i, 2] = al_p
+        salida[i, 3] = al_i
+    return salida
+
+
+@functools.lru_cache(maxsize=512)
+def comparar_sistemas(monto: float, tea: float, plazo: int) -> Dict[str, Dict[str, float]]:
+    """Compara los totales de los sistemas francés y alemán."""
+    pagado_fr, intereses_fr, pagado_al, intereses_al = _totales_nb(
+        monto, calcular_tem(tea), plazo
+    )
+    return {
+        "frances": {
+            "total_pagado": round(pagado_fr, 2),
+            "total_intereses": round(intereses_fr, 2),
+            "total_amortizado": round(monto, 2),
+        },
+        "aleman": {
+            "total_pagado": round(pagado_al, 2),
+            "total_intereses": round(intereses_al, 2),
+            "total_amortizado": round(monto, 2),
+        },
+    }
+
+
+def comparar_sistemas_batch(
+    montos: np.ndarray, teas: np.ndarray, plazos: np.ndarray
+) -> pd.DataFrame:
+    """Compara ambos sistemas para un barrido de escenarios (monto, tea, plazo)."""
+    tems = (1 + np.asarray(teas, dtype=np.float64) / 100) ** (1 / 12) - 1
+    salida = _comparar_batch_nb(
+        np.asarray(montos, dtype=np.float64),
+        tems,
+        np.asarray(plazos, dtype=np.int64),
+    )
+    return pd.DataFrame(
+        salida,
+        columns=[
+            "total_pagado_frances",
+            "total_intereses_frances",
+            "total_pagado_aleman",
+            "total_intereses_aleman",
+        ],
+    )
+
+
+def _tir_mensual(flujos: np.ndarray, tol: float = 1e-9) -> float:
+    """TIR mensual de un vector de flujos (bisección sobre el VAN)."""
+
+    def van(tasa: float) -> float:
+        periodos = np.arange(flujos.size)
+        return float(np.sum(flujos / (1 + tasa) ** periodos))
+
+    # Con la convención de signos del prestatario (desembolso positivo,
+    # pagos negativos) el VAN es creciente en la tasa: negativo en -0.99,
+    # positivo en 10. Un VAN positivo significa que la raíz quedó abajo.
+    bajo, alto = -0.99, 10.0
+    for _ in range(200):
+        medio = (bajo + alto) / 2
+        if van(medio) > 0:
+            alto = medio
+        else:
+            bajo = medio
+        if alto - bajo < tol:
+            break
+    return (bajo + alto) / 2
+
+
+def calcular_tcea_completa(
+    monto: float,
+    tea: float,
+    plazo: int,
+    costo_desembolso: float = 0.0,
+    costo_mensual: float = 0.0,
+    seguro_desgravamen: float = 0.0,
+    portes: float = 0.0,
+) -> float:
+    """TCEA (en %) incluyendo costos de desembolso, mensuales y seguros.
+
+    `costo_desembolso` y `seguro_desgravamen` se expresan en % (del monto
+    y del saldo, respectivamente); `costo_mensual` y `portes` en soles.
+    """
+    tabla = generar_tabla_francesa(monto, tea, plazo)
+    seguro_mensual = tabla["saldo_inicial"].to_numpy() * (seguro_desgravamen / 100)
+    pagos = tabla["cuota"].to_numpy() + seguro_mensual + costo_mensual + portes
+
+    flujos = np.empty(plazo + 1)
+    flujos[0] = monto - monto * (costo_desembolso / 100)
+    flujos[1:] = -pagos
+    tir = _tir_mensual(flujos)
+    return ((1 + tir) ** 12 - 1) * 100
+
+
+def validar_datos_credito(monto: float, tea: float, plazo: int) -> Tuple[bool, str]:
+    """Valida los parámetros de un crédito antes de calcular."""
+    if monto <= 0:
+        return False, "El monto debe ser mayor a cero"
+    if not 0 < tea <= 200:
+        return False, "La TEA debe estar entre 0% y 200%"
+    if not 1 <= plazo <= 480:
+        return False, "El plazo debe estar entre 1 y 480 meses"
+    return True, ""
+
+
+def formatear_moneda(valor: float) -> str:
+    """Formatea un monto en soles: ``S/ 1,234.56``."""
+    return f"S/ {valor:,.2f}"
@@ -0,0 +1,813 @@
+"""Capa de datos de tasas de OptiCred.
+
+Consume la API (que a su vez scrapea la tabla de la SBS) y expone
+consultas de tasas por banco, tipo de crédito y promedios de mercado
+para la interfaz Streamlit.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import re
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from api import api_client
+
+logger = logging.getLogger(__name__)
+
+# Loop de eventos persistente en un hilo de fondo para puentear Streamlit
+# (síncrono) con el cliente asíncrono. A diferencia de asyncio.run por
+# llamada, el loop sobrevive entre consultas, así la sesión aiohttp
+# compartida y su pool keep-alive se reutilizan de verdad.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Arranca (una sola vez) el loop de fondo y lo devuelve."""
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="opticred-api-loop",
+                    daemon=True,
+                ).start()
+                _LOOP = loop
+    return _LOOP
+
+# Caché en disco: la tabla de la SBS cambia a lo sumo una vez al día, así
+# que los arranques en frío del mismo día leen un Parquet local en lugar
+# de volver a golpear la API.
+_CACHE_DIR = Path.home() / ".cache" / "opticred"
+
+# Versión del esquema persistido: al cambiar la forma de los datos en un
+# deploy, subir el número invalida los buckets escritos por código viejo.
+_CACHE_SCHEMA_VERSION = 1
+
+
+def _clave_cache_dia() -> str:
+    """Clave del bucket diario: SHA-256 de la fecha, truncada."""
+    return hashlib.sha256(date.today().isoformat().encode()).hexdigest()[:16]
+
+
+# Prefijos que la SBS antepone a las etiquetas de fila y que las consultas
+# suelen omitir; se usan para generar claves alternativas del índice.
+_PREFIJOS_FILA = ("prestamos ", "creditos ", "tarjetas de credito ")
+
+
+def _variantes_fila(idx_norm: str):
+    """Variantes normalizadas de una etiqueta de fila (prefijos recortados)."""
+    for prefijo in _PREFIJOS_FILA:
+        if idx_norm.startswith(prefijo) and len(idx_norm) > len(prefijo):
+            yield idx_norm[len(prefijo):]
+
+# Encabezados de sección dentro de la tabla de la SBS.
+CATEGORIAS_PRINCIPALES = {
+    "corporativos",
+    "grandes empresas",
+    "medianas empresas",
+    "pequeñas empresas",
+    "microempresas",
+    "consumo",
+    "hipotecarios",
+}
+
+# Categorías que la UI ofrece, con sus opciones y la etiqueta de fila que
+# les corresponde en la tabla de la SBS.
+CATEGORIAS_CREDITO = {
+    "Consumo": {
+        "icono": "🛍️",
+        "opciones": {
+            "Tarjetas de Crédito": "Tarjetas de Crédito",
+            "Préstamos no Revolventes": "Préstamos no Revolventes",
+            "Préstamos Vehiculares": "Préstamos Vehiculares",
+        },
+    },
+    "Hipotecarios": {
+        "icono": "🏠",
+        "opciones": {
+            "Préstamos Hipotecarios": "Préstamos hipotecarios para vivienda",
+        },
+    },
+    "Microempresas": {
+        "icono": "🏪",
+        "opciones": {
+            "Tarjetas de Crédito": "Tarjetas de Crédito",
+            "Préstamos a más de 360 días": "Préstamos a más de 360 días",
+        },
+    },
+    "Pequeñas Empresas": {
+        "icono": "🏢",
+        "opciones": {
+            "Préstamos hasta 30 días": "Préstamos hasta 30 días",
+            "Préstamos a más de 360 días": "Préstamos a más de 360 días",
+        },
+    },
+    "Medianas Empresas": {
+        "icono": "🏭",
+        "opciones": {
+            "Descuentos": "Descuentos",
+            "Préstamos hasta 30 días": "Préstamos hasta 30 días",
+            "Préstamos a más de 360 días": "Préstamos a más de 360 días",
+        },
+    },
+    "Grandes Empresas": {
+        "icono": "🌆",
+        "opciones": {
+            "Descuentos": "Descuentos",
+            "Préstamos hasta 30 días": "Préstamos hasta 30 días",
+            "Préstamos a más de 360 días": "Préstamos a más de 360 días",
+        },
+    },
+    "Corporativos": {
+        "icono": "🏛️",
+        "opciones": {
+            "Descuentos": "Descuentos",
+            "Préstamos hasta 30 días": "Préstamos hasta 30 días",
+            "Préstamos a más de 360 días": "Préstamos a más de 360 días",
+        },
+    },
+}
+
+# Alias con los que los usuarios buscan cada banco de la tabla.
+ALIAS_BANCOS = {
+    "bcp": ["bcp", "credito", "crédito", "banco de credito"],
+    "bbva": ["bbva", "continental"],
+    "interbank": ["interbank", "ibk"],
+    "scotiabank": ["scotiabank", "scotia"],
+    "banbif": ["banbif", "bif"],
+    "pichincha": ["pichincha", "financiero"],
+    "mibanco": ["mibanco", "mi banco"],
+}
+
+# Alias -> banco canónico y una sola alternación compilada que los
+# reconoce todos: _coincide_banco hace un escaneo lineal del texto en vez
+# de K chequeos de substring por par banco/columna. Los alias más largos
+# van primero para que "banco de credito" no quede eclipsado por "credito".
+_ALIAS_CANONICO = {
+    alias: canonico
+    for canonico, alias_lista in ALIAS_BANCOS.items()
+    for alias in alias_lista
+}
+_ALIAS_RE = re.compile(
+    "|".join(map(re.escape, sorted(_ALIAS_CANONICO, key=len, reverse=True)))
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _banco_canonico(texto: str) -> Optional[str]:
+    """Banco canónico reconocido dentro de un texto normalizado, o None."""
+    m = _ALIAS_RE.search(texto)
+    return _ALIAS_CANONICO[m.group(0)] if m else None
+
+# Columnas de la tabla que no corresponden a bancos.
+COLUMNAS_SIN_BANCO = {"", "tipo", "producto", "promedio"}
+
+
+# Mapa plano (categoría, opción) -> etiqueta de fila, aplanado al importar:
+# evita el acceso anidado a CATEGORIAS_CREDITO en cada resolución. Las
+# claves se internan: los selectbox de Streamlit reemiten los mismos
+# literales, y con strings internados la comparación del dict resuelve
+# por identidad de puntero antes de comparar carácter a carácter.
+_FLAT_MAP = {
+    (sys.intern(cat), sys.intern(opcion)): sys.intern(etiqueta)
+    for cat, meta in CATEGORIAS_CREDITO.items()
+    for opcion, etiqueta in meta["opciones"].items()
+}
+
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=512)
+def resolver_fila(categoria: str, tipo_especifico: str) -> str:
+    """Etiqueta de fila de la SBS para una (categoría, opción) ya separada."""
+    return _FLAT_MAP.get((categoria, tipo_especifico), tipo_especifico)
+
+
+@functools.lru_cache(maxsize=256)
+def resolver_fila_tabla(tipo_credito: str) -> Optional[str]:
+    """Adaptador para llamadas externas con el formato "Categoría - Opción".
+
+    Los caminos internos llaman a `resolver_fila` con la tupla directa y
+    se ahorran el f-string y el split; aquí se memoiza el split mismo,
+    el vocabulario de entrada es un puñado de combinaciones fijas.
+    """
+    if " - " not in tipo_credito:
+        return tipo_credito
+    partes = tipo_credito.split(" - ", 1)
+    return resolver_fila(partes[0].strip(), partes[1].strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def normalizar_texto(texto: str) -> str:
+    """Normaliza una etiqueta: minúsculas, sin espacios repetidos.
+
+    Las entradas provienen del conjunto acotado de etiquetas de
+    índice/columna de la SBS, así que tras el warmup prácticamente todas
+    las llamadas son un hit de caché en lugar de una pasada de regex.
+    """
+    return _WS_RE.sub(" ", str(texto).strip().lower())
+
+
+class APITasas:
+    """Consultas de tasas sobre la tabla de la SBS servida por la API."""
+
+    def __init__(self):
+        self._tasas_activas: Optional[pd.DataFrame] = None
+        self._bancos: Optional[List[str]] = None
+        self._cache_cargado = False
+        # Posición (iloc) del encabezado de cada categoría.
+        self._indices_categorias: Dict[str, int] = {}
+        # Rango (inicio, fin) de filas de cada categoría, fijo tras la carga.
+        self._cat_ranges: Dict[str, Tuple[int, int]] = {}
+        # Etiquetas del índice ya normalizadas, alineadas por posición:
+        # el fallback difuso compara contra strings precalculados.
+        self._idx_norm: List[str] = []
+        # La misma lista como ndarray 'U' para np.char.find vectorizado.
+        self._idx_norm_np: Optional[np.ndarray] = None
+        # (categoría, primeros 12 chars normalizados) -> posición: resuelve
+        # en O(1) etiquetas que derivaron en la cola pero conservan el
+        # prefijo, antes de caer al barrido por substring.
+        self._prefijo_index: Dict[Tuple[str, str], int] = {}
+        # Mapa (categoria_norm, fila_norm) -> iloc, construido una sola
+        # vez al cargar: las búsquedas calientes son un hit de dict en
+        # lugar de recorrer el índice normalizando con regex fila a fila.
+        self._fila_index: Dict[Tuple[str, str], int] = {}
+        # Clasificación de columnas, precalculada una vez en la carga.
+        self._bank_cols: List[str] = []
+        self._promedio_col: Optional[str] = None
+        self._col_positions: Dict[str, int] = {}
+        # Matriz numérica (filas x columnas de banco) coercionada una sola
+        # vez en la carga y cuantizada a puntos básicos int16 (tasa*100,
+        # -1 = sin tasa): 4x menos bytes que float64 y los min/max corren
+        # sobre enteros pequeños.
+        self._tasas_bp: Optional[np.ndarray] = None
+        # alias normalizado -> posición en _bank_cols, resuelto una vez:
+        # get_tea deja de escanear todas las columnas por cada consulta.
+        self._banco_col_map: Dict[str, int] = {}
+        # Columna "Promedio" ya coercionada, alineada con las filas.
+        self._promedio_values: Optional[np.ndarray] = None
+        # _bank_cols como ndarray de objetos para indexado fancy.
+        self._bank_cols_arr: Optional[np.ndarray] = None
+        # Memo por instancia de las consultas calientes; se invalida solo
+        # desde cargar_datos (la tabla cambia a lo sumo una vez al día).
+        self._memo: Dict[Tuple, object] = {}
+
+    # ------------------------------------------------------------------
+    # Carga de datos
+    # ------------------------------------------------------------------
+
+    def _ejecutar_async(self, coro):
+        """Ejecuta una corrutina desde el contexto síncrono de Streamlit."""
+        return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout=60)
+
+    async def _fetch(self):
+        # Cliente compartido del módulo api_client: como todas las
+        # corrutinas corren en el mismo loop de fondo, su sesión aiohttp
+        # (y el pool de conexiones) persiste entre cargas.
+        client = api_client._get_client()
+        # Llamadas independientes: en paralelo la carga cuesta
+        # max(t_tasas, t_bancos) en lugar de la suma.
+        return await asyncio.gather(
+            client.get_tasas_activas(), client.get_bancos()
+        )
+
+    def _leer_cache_disco(self):
+        """Devuelve (tasas, bancos) del bucket diario en disco, o None."""
+        clave = _clave_cache_dia()
+        ruta_tasas = _CACHE_DIR / f"tasas_{clave}.parquet"
+        ruta_bancos = _CACHE_DIR / f"bancos_{clave}.json"
+        ruta_meta = _CACHE_DIR / "metadata.json"
+        if not (ruta_tasas.exists() and ruta_bancos.exists() and ruta_meta.exists()):
+            return None
+        try:
+            meta = json.loads(ruta_meta.read_text(encoding="utf-8"))
+            if meta.get("schema_version") != _CACHE_SCHEMA_VERSION:
+                return None
+            tasas = pd.read_parquet(ruta_tasas).set_index("index")
+            tasas.index.name = None
+            bancos = json.loads(ruta_bancos.read_text(encoding="utf-8"))
+            return tasas, bancos
+        except Exception as exc:  # caché corrupto: se ignora y se re-fetchea
+            logger.warning("Caché en disco ilegible, se descarta: %s", exc)
+            return None
+
+    def _escribir_cache_disco(self, tasas: pd.DataFrame, bancos: List[str]) -> None:
+        """Persiste el bucket diario; los buckets viejos se eliminan."""
+        clave = _clave_cache_dia()
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for viejo in _CACHE_DIR.glob("*.parquet"):
+                if clave not in viejo.name:
+                    viejo.unlink(missing_ok=True)
+            for viejo in _CACHE_DIR.glob("*.json"):
+                if clave not in viejo.name:
+                    viejo.unlink(missing_ok=True)
+            tasas.rename_axis("index").reset_index().to_parquet(
+                _CACHE_DIR / f"tasas_{clave}.parquet"
+            )
+            (_CACHE_DIR / f"bancos_{clave}.json").write_text(
+                json.dumps(bancos, ensure_ascii=False), encoding="utf-8"
+            )
+            (_CACHE_DIR / "metadata.json").write_text(
+                json.dumps(
+                    {
+                        "schema_version": _CACHE_SCHEMA_VERSION,
+                        "fetched_at": date.today().isoformat(),
+                    }
+                ),
+                encoding="utf-8",
+            )
+        except Exception as exc:  # el disco es un extra, nunca un bloqueo
+            logger.warning("No se pudo escribir el caché en disco: %s", exc)
+
+    def cargar_datos(self, forzar_api: bool = False) -> bool:
+        """Carga tasas y bancos (disco si hay bucket del día, si no API).
+
+        Con `forzar_api` se salta el bucket en disco y va directo a la
+        API (reescribiendo el bucket si la carga funciona): es lo que
+        usan los refrescos, que existen justamente para traer datos más
+        nuevos que los ya persistidos.
+        """
+        cacheado = None if forzar_api else self._leer_cache_disco()
+        if cacheado is not None:
+            tasas, bancos = cacheado
+        else:
+            try:
+                tasas, bancos = self._ejecutar_async(self._fetch())
+            except Exception as exc:
+                logger.error("No se pudo cargar datos desde la API: %s", exc)
+                return False
+            self._escribir_cache_disco(tasas, bancos)
+        self._tasas_activas = tasas
+        self._bancos = bancos
+        self._construir_indice_categorias()
+        self._memo.clear()
+        self._cache_cargado = True
+        # Con los datos listos, las consultas entran directo al camino
+        # caliente: el atributo de instancia eclipsa al método de clase y
+        # se ahorra el chequeo de carga en cada una de las ~30+ llamadas
+        # por render.
+        self.get_tea = self._get_tea_caliente
+        self.get_promedio = self._get_promedio_caliente
+        self.get_tasas_por_tipo = self._get_tasas_por_tipo_caliente
+        return True
+
+    def _construir_indice_categorias(self) -> None:
+        """Recorre el índice una sola vez y arma los mapas de búsqueda."""
+        self._indices_categorias = {}
+        self._fila_index = {}
+        # Se vacía junto con el resto: sus entradas van con setdefault,
+        # así que posiciones de una carga anterior ganarían a las nuevas.
+        self._prefijo_index = {}
+        self._bank_cols = []
+        self._promedio_col = None
+        self._col_positions = {}
+        if self._tasas_activas is None:
+            return
+
+        # El índice son ~50 etiquetas en español que se repiten entre cargas;
+        # como categórico, las búsquedas y copias trabajan sobre códigos int8
+        # en lugar de objetos str.
+        self._tasas_activas.index = pd.CategoricalIndex(self._tasas_activas.index)
+
+        # Clasificar columnas una sola vez: evita re-normalizar y comparar
+        # contra el skip-set en cada consulta.
+        for pos, col in enumerate(self._tasas_activas.columns):
+            col_norm = str(col).strip().lower()
+            self._col_positions[str(col)] = pos
+            if "promedio" in col_norm:
+                self._promedio_col = str(col)
+            elif col_norm not in COLUMNAS_SIN_BANCO:
+                self._bank_cols.append(str(col))
+
+        # Las tasas traen <= 2 decimales, así que int16 en puntos básicos
+        # las representa exacto (hasta +-327%); -1 marca celda sin tasa.
+        v = (
+            self._tasas_activas[self._bank_cols]
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=np.float64)
+        )
+        self._tasas_bp = np.where(
+            np.isfinite(v) & (v > 0), np.round(v * 100), -1
+        ).astype(np.int16)
+        # Columna de promedio como ndarray aparte: get_promedio la lee por
+        # posición sin pasar por iloc.
+        if self._promedio_col is not None:
+            self._promedio_values = pd.to_numeric(
+                self._tasas_activas[self._promedio_col], errors="coerce"
+            ).to_numpy(dtype=np.float32)
+        else:
+            self._promedio_values = None
+
+        self._bank_cols_arr = np.asarray(self._bank_cols, dtype=object)
+
+        # Tabla alias -> columna de banco (resuelta una sola vez).
+        self._banco_col_map = {}
+        for i, col in enumerate(self._bank_cols):
+            col_norm = col.strip().lower()
+            self._banco_col_map[col_norm] = i
+            for canonico, alias_lista in ALIAS_BANCOS.items():
+                if canonico in col_norm:
+                    for alias in alias_lista:
+                        self._banco_col_map.setdefault(alias, i)
+
+        self._idx_norm = [normalizar_texto(str(idx)) for idx in self._tasas_activas.index]
+        self._idx_norm_np = np.asarray(self._idx_norm, dtype=str)
+
+        categoria_actual = None
+        for i, idx_norm in enumerate(self._idx_norm):
+            if idx_norm in CATEGORIAS_PRINCIPALES:
+                categoria_actual = idx_norm
+                self._indices_categorias[idx_norm] = i
+            elif categoria_actual is not None:
+                self._fila_index[(categoria_actual, idx_norm)] = i
+                self._prefijo_index.setdefault((categoria_actual, idx_norm[:12]), i)
+                # Variantes recortadas de la misma etiqueta como claves
+                # adicionales: las consultas que omiten el prefijo
+                # ("tarjetas de crédito" por "préstamos tarjetas de
+                # crédito") resuelven en O(1) sin caer al fallback.
+                for variante in _variantes_fila(idx_norm):
+                    self._fila_index.setdefault((categoria_actual, variante), i)
+
+        # Rangos por categoría, ordenando una sola vez aquí en lugar de
+        # en cada búsqueda con fallback.
+        self._cat_ranges = {}
+        ordenados = sorted(self._indices_categorias.items(), key=lambda kv: kv[1])
+        total = len(self._tasas_activas)
+        for j, (cat, inicio) in enumerate(ordenados):
+            fin = ordenados[j + 1][1] if j + 1 < len(ordenados) else total
+            self._cat_ranges[cat] = (inicio, fin)
+
+    # ------------------------------------------------------------------
+    # Búsqueda de filas
+    # ------------------------------------------------------------------
+
+    def _resolver_fila_tabla(self, tipo_credito: str) -> Optional[str]:
+        """Traduce "Categoría - Opción" a la etiqueta de fila de la SBS."""
+        return resolver_fila_tabla(tipo_credito)
+
+    def _buscar_pos_por_indice(self, categoria: str, fila_buscar: str) -> Optional[int]:
+        """Posición iloc de una fila dentro del rango de su categoría.
+
+        Todos los caminos internos trabajan con la posición entera y leen
+        `_tasas_bp[pos]` directamente: indexar el DataFrame con iloc
+        materializa una Series con boxing por columna que nadie necesita.
+        """
+        df = self._tasas_activas
+        if df is None:
+            return None
+        categoria_norm = normalizar_texto(categoria)
+        fila_buscar_norm = normalizar_texto(fila_buscar)
+
+        # Camino rápido: índice precalculado en la carga.
+        idx = self._fila_index.get((categoria_norm, fila_buscar_norm))
+        if idx is not None:
+            return idx
+
+        # Fallback en dos niveles: primero el índice de prefijos (etiquetas
+        # que cambiaron en la cola pero no en los primeros 12 caracteres)...
+        idx = self._prefijo_index.get((categoria_norm, fila_buscar_norm[:12]))
+        if idx is not None and len(fila_buscar_norm) >= 12:
+            return idx
+
+        # ...y recién después la coincidencia parcial dentro del rango.
+        rango = self._cat_ranges.get(categoria_norm)
+        if rango is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Categoría no encontrada: %s", categoria)
+            return None
+        inicio, fin = rango
+        # Caso común (lo buscado es substring de la etiqueta), vectorizado:
+        # un solo np.char.find en C sobre el rango de la categoría.
+        segmento = self._idx_norm_np[inicio + 1 : fin]
+        hits = np.flatnonzero(np.char.find(segmento, fila_buscar_norm) >= 0)
+        if hits.size:
+            i = inicio + 1 + int(hits[0])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fila encontrada por coincidencia parcial: %s", df.index[i])
+            return i
+        # Caso inverso (la etiqueta es substring de lo buscado), raro.
+        for i in range(inicio + 1, fin):
+            if self._idx_norm[i] in fila_buscar_norm:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Fila encontrada por coincidencia parcial: %s", df.index[i])
+                return i
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fila no encontrada: %s / %s", categoria, fila_buscar)
+        return None
+
+    def _coincide_banco(self, banco_buscado: str, columna: str) -> bool:
+        """Determina si una columna de la tabla corresponde al banco buscado."""
+        banco_norm = str(banco_buscado).strip().lower()
+        col_norm = str(columna).strip().lower()
+        if banco_norm == col_norm:
+            return True
+        if banco_norm in col_norm or col_norm in banco_norm:
+            return True
+        canonico = _banco_canonico(banco_norm)
+        return canonico is not None and canonico == _banco_canonico(col_norm)
+
+    def _filtrar_bancos_con_tasa(self, pos: int) -> List[str]:
+        """Bancos que publican una tasa (> 0) en la fila dada."""
+        row = self._tasas_bp[pos]
+        mask = row > 0
+        return [self._bank_cols[i] for i in np.nonzero(mask)[0]]
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def get_tea(self, banco: str, categoria: str, tipo_credito: str) -> Optional[float]:
+        """TEA de un banco para un tipo de crédito (camino frío)."""
+        if not self._cache_cargado:
+            self.cargar_datos()
+        return self._get_tea_caliente(banco, categoria, tipo_credito)
+
+    def _get_tea_caliente(self, banco: str, categoria: str, tipo_credito: str) -> Optional[float]:
+        clave = ("tea", banco, categoria, tipo_credito)
+        if clave in self._memo:
+            return self._memo[clave]
+        self._memo[clave] = valor = self._get_tea_impl(banco, categoria, tipo_credito)
+        return valor
+
+    def _find_pos(self, categoria: str, tipo_credito: str) -> Optional[int]:
+        """Resuelve la etiqueta y localiza su posición en un solo punto.
+
+        Todos los métodos públicos pasan por aquí: las optimizaciones de
+        búsqueda (índice exacto, variantes, prefijos, fallback) viven en
+        un único camino en lugar de copiarse por método.
+        """
+        fila = resolver_fila(categoria, tipo_credito)
+        return self._buscar_pos_por_indice(categoria, fila)
+
+    def _get_tea_impl(self, banco: str, categoria: str, tipo_credito: str) -> Optional[float]:
+        pos = self._find_pos(categoria, tipo_credito)
+        if pos is None:
+            return None
+        col_idx = self._banco_col_map.get(str(banco).strip().lower())
+        if col_idx is not None:
+            bp = int(self._tasas_bp[pos, col_idx])
+            return bp / 100.0 if bp > 0 else None
+        # Fallback para nombres que no están en la tabla de alias.
+        for i, col in enumerate(self._bank_cols):
+            if self._coincide_banco(banco, col):
+                bp = int(self._tasas_bp[pos, i])
+                return bp / 100.0 if bp > 0 else None
+        return None
+
+    def get_promedio(self, categoria: str, tipo_credito: str) -> Optional[float]:
+        """Tasa promedio del mercado para un tipo de crédito (camino frío)."""
+        if not self._cache_cargado:
+            self.cargar_datos()
+        return self._get_promedio_caliente(categoria, tipo_credito)
+
+    def _get_promedio_caliente(self, categoria: str, tipo_credito: str) -> Optional[float]:
+        clave = ("promedio", categoria, tipo_credito)
+        if clave in self._memo:
+            return self._memo[clave]
+        self._memo[clave] = valor = self._get_promedio_impl(categoria, tipo_credito)
+        return valor
+
+    def _get_promedio_impl(self, categoria: str, tipo_credito: str) -> Optional[float]:
+        pos = self._find_pos(categoria, tipo_credito)
+        if pos is None:
+            return None
+        if self._promedio_values is not None:
+            valor = float(self._promedio_values[pos])
+            if valor == valor:  # no es NaN
+                return valor
+        # Sin columna de promedio publicada: promedio simple de los bancos.
+        row = self._tasas_bp[pos]
+        validos = row[row > 0]
+        return float(validos.mean()) / 100.0 if validos.size else None
+
+    def get_tasas_por_tipo(self, categoria: str, tipo_credito: str) -> Dict[str, float]:
+        """Dict banco -> tasa para un tipo de crédito (camino frío).
+
+        El memo devuelve el mismo dict en llamadas repetidas; los
+        consumidores lo tratan como de solo lectura.
+        """
+        if not self._cache_cargado:
+            self.cargar_datos()
+        return self._get_tasas_por_tipo_caliente(categoria, tipo_credito)
+
+    def _get_tasas_por_tipo_caliente(self, categoria: str, tipo_credito: str) -> Dict[str, float]:
+        clave = ("tasas", categoria, tipo_credito)
+        if clave in self._memo:
+            return self._memo[clave]
+        self._memo[clave] = valor = self._get_tasas_por_tipo_impl(categoria, tipo_credito)
+        return valor
+
+    def _get_tasas_por_tipo_impl(self, categoria: str, tipo_credito: str) -> Dict[str, float]:
+        pos = self._find_pos(categoria, tipo_credito)
+        if pos is None:
+            return {}
+        row = self._tasas_bp[pos]
+        idxs = np.nonzero(row > 0)[0]
+        return dict(zip(self._bank_cols_arr[idxs], row[idxs] / 100.0))
+
+    def _row_values(self, categoria: str, tipo_credito: str) -> Optional[np.ndarray]:
+        """Fila int16 en puntos básicos (alineada con `_bank_cols`)."""
+        if not self._cache_cargado:
+            self.cargar_datos()
+        pos = self._find_pos(categoria, tipo_credito)
+        if pos is None:
+            return None
+        return self._tasas_bp[pos]
+
+    def get_rango_detalle(
+        self, categoria: str, tipo_credito: str
+    ) -> Optional[Tuple[Tuple[str, float], Tuple[str, float], float]]:
+        """(mejor, peor, promedio) de un tipo de crédito en una sola pasada.
+
+        La UI suele mostrar las tres cifras juntas; resolver la fila y
+        enmascararla una única vez evita repetir el trabajo por métrica.
+        """
+        row = self._row_values(categoria, tipo_credito)
+        if row is None:
+            return None
+        validos = np.nonzero(row > 0)[0]
+        if validos.size == 0:
+            return None
+        tasas = row[validos]
+        i_min = validos[np.argmin(tasas)]
+        i_max = validos[np.argmax(tasas)]
+        return (
+            (self._bank_cols[i_min], row[i_min] / 100.0),
+            (self._bank_cols[i_max], row[i_max] / 100.0),
+            float(tasas.mean()) / 100.0,
+        )
+
+    def get_mejor_tasa(self, categoria: str, tipo_credito: str) -> Optional[Tuple[str, float]]:
+        """Banco con la tasa más baja para un tipo de crédito."""
+        detalle = self.get_rango_detalle(categoria, tipo_credito)
+        return detalle[0] if detalle is not None else None
+
+    def get_peor_tasa(self, categoria: str, tipo_credito: str) -> Optional[Tuple[str, float]]:
+        """Banco con la tasa más alta para un tipo de crédito."""
+        detalle = self.get_rango_detalle(categoria, tipo_credito)
+        return detalle[1] if detalle is not None else None
+
+    def get_rango_tasas(self, categoria: str, tipo_credito: str) -> Optional[Tuple[float, float]]:
+        """(mínimo, máximo) de las tasas publicadas para un tipo de crédito."""
+        row = self._row_values(categoria, tipo_credito)
+        if row is None:
+            return None
+        validas = row[row > 0]
+        if validas.size == 0:
+            return None
+        return validas.min() / 100.0, validas.max() / 100.0
+
+    def get_bancos(self, categoria: Optional[str] = None, tipo_credito: Optional[str] = None) -> List[str]:
+        """Bancos disponibles, opcionalmente filtrados por tipo de crédito."""
+        if not self._cache_cargado:
+            self.cargar_datos()
+        if categoria is None or tipo_credito is None:
+            return list(self._bancos or [])
+        pos = self._find_pos(categoria, tipo_credito)
+        if pos is None:
+            return []
+        return self._filtrar_bancos_con_tasa(pos)
+
+    def get_dataframe_tasas(self) -> Optional[pd.DataFrame]:
+        """DataFrame crudo de tasas (para exportar o mostrar)."""
+        if not self._cache_cargado:
+            self.cargar_datos()
+        return self._tasas_activas
+
+
+# ---------------------------------------------------------------------------
+# Helpers para Streamlit
+# ---------------------------------------------------------------------------
+
+# Caché stale-while-revalidate de cargar_datos_api. Se guarda a nivel de
+# módulo (no en st.session_state) para compartirse entre sesiones y poder
+# actualizarse desde el hilo de refresco sin tocar contexto de Streamlit.
+_DATOS_TTL = 300  # segundos
+_datos_cache: Dict[str, object] = {"valor": None, "ts": 0.0}
+_datos_lock = threading.Lock()
+_refresco_en_curso = False
+
+
+def _refrescar_datos() -> None:
+    """Recarga desde la API y publica el resultado en el caché compartido."""
+    global _refresco_en_curso
+    try:
+        api = APITasas()
+        # Directo a la API: el bucket del día en disco devolvería los
+        # mismos datos que motivaron el refresco.
+        if api.cargar_datos(forzar_api=True):
+            with _datos_lock:
+                _datos_cache["valor"] = (api._tasas_activas, api._bancos, True)
+                _datos_cache["ts"] = time.monotonic()
+    except Exception as exc:  # el dato viejo sigue sirviéndose
+        logger.error("Refresco de datos falló: %s", exc)
+    finally:
+        with _datos_lock:
+            _refresco_en_curso = False
+
+
+def cargar_datos_api():
+    """Carga (tasas, bancos, conectado) con stale-while-revalidate.
+
+    Dentro del TTL se sirve el caché; entre TTL y 2xTTL se sirve el dato
+    viejo y un hilo de fondo lo refresca (ningún usuario espera a la
+    SBS); solo en frío o con datos muy vencidos la llamada bloquea.
+    """
+    global _refresco_en_curso
+    with _datos_lock:
+        valor = _datos_cache["valor"]
+        edad = time.monotonic() - _datos_cache["ts"]  # type: ignore[operator]
+
+    if valor is not None and edad < _DATOS_TTL:
+        return valor
+
+    if valor is not None and edad < 2 * _DATOS_TTL:
+        lanzar = False
+        with _datos_lock:
+            if not _refresco_en_curso:
+                _refresco_en_curso = True
+                lanzar = True
+        if lanzar:
+            threading.Thread(
+                target=_refrescar_datos, name="opticred-refresh", daemon=True
+            ).start()
+        return valor
+
+    # Frío o vencido más allá del período de gracia: refresco bloqueante.
+    with _datos_lock:
+        _refresco_en_curso = True
+    _refrescar_datos()
+    with _datos_lock:
+        return _datos_cache["valor"] if _datos_cache["valor"] is not None else (None, None, False)
+
+
+@st.cache_resource(ttl=_DATOS_TTL, show_spinner=False)
+def _get_api() -> Optional[APITasas]:
+    """Instancia APITasas completamente inicializada, renovada por TTL.
+
+    `st.cache_resource` conserva el objeto (con `_fila_index`,
+    `_banco_col_map` y `_tasas_bp` ya construidos) entre reruns, en
+    lugar de reconstruir una instancia y reindexar en cada helper. El
+    TTL obliga a releer `_datos_cache` cada tanto: sin él, el objeto
+    quedaba congelado de por vida y los refrescos de
+    `cargar_datos_api` nunca llegaban a la UI.
+    """
+    tasas, bancos, ok = cargar_datos_api()
+    if not ok:
+        return None
+    api = APITasas()
+    api._tasas_activas = tasas
+    api._bancos = bancos
+    api._construir_indice_categorias()
+    api._cache_cargado = True
+    return api
+
+
+def obtener_api() -> Optional[APITasas]:
+    """Instancia APITasas compartida del proceso (None si la API no responde)."""
+    api = _get_api()
+    if api is None:
+        # No congelar el fallo durante todo el TTL: el próximo rerun
+        # vuelve a intentar la carga.
+        _get_api.clear()
+    return api
+
+
+def obtener_bancos(categoria: Optional[str] = None, tipo_credito: Optional[str] = None) -> List[str]:
+    """Bancos disponibles según los datos cacheados."""
+    api = obtener_api()
+    if api is None:
+        return []
+    return api.get_bancos(categoria, tipo_credito)
+
+
+def obtener_tea(banco: str, categoria: str, tipo_credito: str) -> Optional[float]:
+    """TEA de un banco según los datos cacheados."""
+    api = obtener_api()
+    if api is None:
+        return None
+    return api.get_tea(banco, categoria, tipo_credito)
+
+
+def obtener_promedio(categoria: str, tipo_credito: str) -> Optional[float]:
+    """Tasa promedio del mercado según los datos cacheados."""
+    api = obtener_api()
+    if api is None:
+        return None
+    return api.get_promedio(categoria, tipo_credito)
@@ -0,0 +1,626 @@
+"""Calculadora de créditos: simulación, comparación y exportación."""
+
+import functools
+import io
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from modules.amortizacion import (
+    calcular_tcea_completa,
+    calcular_totales,
+    comparar_sistemas,
+    formatear_moneda,
+    generar_tabla_alemana,
+    generar_tabla_francesa,
+    validar_datos_credito,
+)
+from modules.api_tasas import CATEGORIAS_CREDITO, obtener_api
+
+_CSS_PATH = Path(__file__).parent / "static" / "calculadora.css"
+
+# CATEGORIAS_CREDITO es constante: las listas para los selectbox se
+# materializan una vez en vez de en cada rerun.
+_CATEGORIAS_LIST = list(CATEGORIAS_CREDITO.keys())
+
+
+@functools.lru_cache(maxsize=None)
+def _opciones_for(categoria: str) -> list:
+    """Opciones de producto de una categoría, materializadas una vez."""
+    return list(CATEGORIAS_CREDITO[categoria]["opciones"].keys())
+
+
+# Por encima de este número de cuotas las líneas se submuestrean antes de
+# enviarlas a plotly: el navegador parsea y dibuja menos puntos.
+_MAX_PUNTOS_LINEA = 120
+
+
+def _indices_muestra(n: int) -> Optional[np.ndarray]:
+    """Índices equiespaciados para submuestrear una serie de n puntos.
+
+    Devuelve None cuando la serie cabe completa (sin copia en ese caso).
+    Las series graficadas son monótonas (saldo decreciente, acumulados
+    crecientes), así que el muestreo uniforme no pierde extremos; el
+    primer y el último punto siempre se incluyen.
+    """
+    if n <= _MAX_PUNTOS_LINEA:
+        return None
+    return np.unique(np.linspace(0, n - 1, _MAX_PUNTOS_LINEA).round().astype(np.int64))
+
+
+class _Costos(NamedTuple):
+    """Costos adicionales estimados del crédito."""
+
+    adicionales: float
+    total: float
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_costs(
+    monto: float,
+    plazo: int,
+    costo_desembolso: float,
+    costo_mensual: float,
+    seguro_desgravamen: float,
+    portes: float,
+    total_pagado: float,
+) -> _Costos:
+    """Costos adicionales y costo total, memoizados por parámetros.
+
+    Aritmética pura sobre escalares: el seguro se aproxima sobre el
+    saldo promedio (monto/2) durante todo el plazo.
+    """
+    seguro_total = (monto / 2) * (seguro_desgravamen / 100) * plazo
+    adicionales = monto * (costo_desembolso / 100) + (costo_mensual + portes) * plazo + seguro_total
+    return _Costos(adicionales=adicionales, total=total_pagado + adicionales)
+
+
+@st.cache_data(show_spinner=False)
+def _compute_amort(monto: float, tea: float, plazo: int, sistema: str):
+    """Tabla de amortización y totales, memoizados por parámetros.
+
+    Streamlit re-ejecuta el script completo en cada interacción (cambiar
+    de pestaña, descargar); con esto la tabla solo se reconstruye cuando
+    cambian los parámetros del crédito.
+    """
+    if sistema == "francés":
+        tabla = generar_tabla_francesa(monto, tea, plazo)
+    else:
+        tabla = generar_tabla_alemana(monto, tea, plazo)
+    return tabla, calcular_totales(tabla)
+
+
+@functools.lru_cache(maxsize=128)
+def _validar(monto: float, tea: float, plazo: int) -> Tuple[bool, str]:
+    """Validación memoizada: re-clics con los mismos parámetros no la repiten."""
+    return validar_datos_credito(monto, tea, plazo)
+
+
+@functools.lru_cache(maxsize=256)
+def _tcea_cached(
+    monto: float,
+    tea: float,
+    plazo: int,
+    costo_desembolso: float,
+    costo_mensual: float,
+    seguro_desgravamen: float,
+    portes: float,
+) -> Optional[float]:
+    """TCEA memoizada: re-clics de Calcular con los mismos parámetros
+    (p. ej. para re-descargar el PDF) no repiten la bisección de la TIR."""
+    try:
+        return calcular_tcea_completa(
+            monto, tea, plazo, costo_desembolso, costo_mensual, seguro_desgravamen, portes
+        )
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _resumen_texto(
+    categoria: str,
+    producto: str,
+    banco: str,
+    tea: float,
+    tcea: Optional[float],
+    monto: float,
+    plazo: int,
+    sistema: str,
+    cuota_inicial: float,
+    total_pagado: float,
+    total_intereses: float,
+) -> str:
+    """Bloque "Resumen para copiar", memoizado por parámetros escalares.
+
+    Cada rerun reconstruía el texto con varias llamadas a
+    formatear_moneda aunque nada hubiera cambiado.
+    """
+    return (
+        f"OptiCred — {categoria} / {producto}\n"
+        f"Banco: {banco} | TEA: {tea:.2f}% | "
+        f"TCEA: {f'{tcea:.2f}%' if tcea is not None else 'n/d'}\n"
+        f"Monto: {formatear_moneda(monto)} a {plazo} meses ({sistema})\n"
+        f"Cuota inicial: {formatear_moneda(cuota_inicial)}\n"
+        f"Total pagado: {formatear_moneda(total_pagado)} "
+        f"(intereses {formatear_moneda(total_intereses)})"
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _cargar_css() -> str:
+    """Lee la hoja de estilos de la calculadora una sola vez por proceso."""
+    return f"<style>{_CSS_PATH.read_text(encoding='utf-8')}</style>"
+
+
+# Plantillas HTML compiladas una vez al importar: cada rerun solo paga el
+# .format con los valores nuevos, no el re-parseo del f-string triple.
+_CARD_MERCADO_TMPL = """
+<div class="opticred-card">
+  <h4>Mercado: {categoria} — {producto}</h4>
+  <p>Mejor tasa: <span class="opticred-tasa-mejor">{mejor_banco} ({mejor_tasa:.2f}%)</span>
+     · Peor tasa: <span class="opticred-tasa-peor">{peor_banco} ({peor_tasa:.2f}%)</span>
+     · Promedio: {promedio:.2f}%
+     · {num_bancos} bancos publican tasa</p>
+</div>
+"""
+
+_FILA_TASA_TMPL = (
+    '<div class="opticred-resumen"><strong>{banco}</strong>: {tasa:.2f}%</div>'
+)
+
+_METRIC_CARD_TMPL = (
+    '<div class="metric-card"><div class="metric-label">{label}</div>'
+    '<div class="metric-value">{value}</div></div>'
+)
+
+
+class _MarketSnapshot(NamedTuple):
+    """Foto del mercado para un producto: todo lo que la UI muestra junto."""
+
+    promedio: Optional[float]
+    mejor: Optional[Tuple[str, float]]
+    peor: Optional[Tuple[str, float]]
+    bancos: List[str]
+    tasas: Dict[str, float]
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _market_snapshot(categoria: str, producto: str, _dia: str) -> _MarketSnapshot:
+    """Agrupa en una sola llamada memoizada las consultas de mercado.
+
+    `_dia` entra solo como parte de la clave: al cambiar el día (cuando
+    la SBS puede publicar tasas nuevas) el caché se invalida solo. El
+    TTL acompaña al de `_get_api`: cuando la instancia se renueva con
+    datos frescos, las consultas memoizadas caducan con ella.
+    """
+    api = obtener_api()
+    detalle = api.get_rango_detalle(categoria, producto)
+    mejor, peor, promedio = detalle if detalle is not None else (None, None, None)
+    if promedio is None:
+        promedio = api.get_promedio(categoria, producto)
+    return _MarketSnapshot(
+        promedio=promedio,
+        mejor=mejor,
+        peor=peor,
+        bancos=api.get_bancos(categoria, producto),
+        tasas=api.get_tasas_por_tipo(categoria, producto),
+    )
+
+
+# El hash por contenidos de hash_pandas_object es O(N) pero mucho más
+# barato que re-serializar el CSV o el workbook entero en cada rerun.
+_HASH_TABLA = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d).values.tobytes()}
+
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs=_HASH_TABLA)
+def _csv_bytes(tabla: pd.DataFrame) -> bytes:
+    """Serialización CSV del cronograma, memoizada por contenidos."""
+    return tabla.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs=_HASH_TABLA)
+def _excel_bytes(tabla: pd.DataFrame) -> bytes:
+    """Workbook Excel del cronograma, memoizado por contenidos.
+
+    xlsxwriter escribe el workbook varias veces más rápido que openpyxl
+    para hojas numéricas. Ojo: sin constant_memory — to_excel emite las
+    celdas columna por columna y ese modo descarta las escrituras a
+    filas ya volcadas, dejando la hoja casi vacía.
+    """
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
+        tabla.to_excel(writer, index=False, sheet_name="Cronograma")
+    return excel_buffer.getvalue()
+
+
+@st.cache_data(max_entries=8, show_spinner=False, hash_funcs=_HASH_TABLA)
+def _pdf_cronograma_bytes(tabla: pd.DataFrame) -> bytes:
+    """PDF del cronograma completo (todas las cuotas), memoizado.
+
+    Usa la variante de Canvas crudo del generador: para plazos largos
+    evita el layout cuadrático de platypus.
+    """
+    from modules.pdf_generator import generar_pdf_cronograma_completo
+
+    return generar_pdf_cronograma_completo(tabla).getvalue()
+
+
+def mostrar_calculadora_creditos() -> None:
+    """Renderiza la sección de la calculadora de créditos."""
+    st.header("🧮 Calculadora de Créditos")
+    st.markdown(_cargar_css(), unsafe_allow_html=True)
+
+    api = obtener_api()
+    if api is None:
+        st.error("No se pudo conectar con la API de tasas. Intenta nuevamente.")
+        return
+
+    # ------------------------------------------------------------------
+    # Selección de producto y banco
+    # ------------------------------------------------------------------
+    col_cat, col_prod, col_banco = st.columns(3)
+    with col_cat:
+        categoria = st.selectbox(
+            "Categoría de crédito",
+            _CATEGORIAS_LIST,
+            format_func=lambda c: f"{CATEGORIAS_CREDITO[c]['icono']} {c}",
+        )
+    with col_prod:
+        producto = st.selectbox("Producto", _opciones_for(categoria))
+    mercado = _market_snapshot(categoria, producto, date.today().isoformat())
+    with col_banco:
+        banco = st.selectbox(
+            "Banco", mercado.bancos if mercado.bancos else ["(sin datos)"]
+        )
+
+    # ------------------------------------------------------------------
+    # Información de mercado
+    # ------------------------------------------------------------------
+    tea_banco = api.get_tea(banco, categoria, producto)
+    promedio_mercado = mercado.promedio
+    mejor = mercado.mejor
+    peor = mercado.peor
+    tasas_mercado = mercado.tasas
+
+    if mejor is not None and peor is not None:
+        st.markdown(
+            _CARD_MERCADO_TMPL.format(
+                categoria=categoria,
+                producto=producto,
+                mejor_banco=mejor[0],
+                mejor_tasa=mejor[1],
+                peor_banco=peor[0],
+                peor_tasa=peor[1],
+                promedio=promedio_mercado,
+                num_bancos=len(tasas_mercado),
+            ),
+            unsafe_allow_html=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Parámetros del crédito (agrupados en un form: Streamlit solo rerenderiza
+    # al enviar, no por cada tecla o movimiento de slider)
+    # ------------------------------------------------------------------
+    with st.form("credito_form"):
+        col_monto, col_tea, col_plazo = st.columns(3)
+        with col_monto:
+            monto = st.number_input(
+                "Monto del crédito (S/)", min_value=500.0, max_value=5_000_000.0,
+                value=20_000.0, step=500.0,
+            )
+        with col_tea:
+            tea = st.number_input(
+                "TEA (%)", min_value=0.1, max_value=200.0,
+                value=float(tea_banco) if tea_banco else 15.0, step=0.1,
+            )
+        with col_plazo:
+            plazo = st.slider("Plazo (meses)", min_value=6, max_value=480, value=24)
+
+        sistema = st.radio(
+            "Sistema de amortización", ["francés", "alemán"], horizontal=True
+        )
+
+        with st.expander("Costos adicionales (opcional)"):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                costo_desembolso = st.number_input("Comisión de desembolso (%)", 0.0, 10.0, 0.0, 0.1)
+                seguro_desgravamen = st.number_input("Seguro de desgravamen (% del saldo)", 0.0, 5.0, 0.05, 0.01)
+            with col_b:
+                costo_mensual = st.number_input("Gastos administrativos mensuales (S/)", 0.0, 500.0, 0.0, 1.0)
+                portes = st.number_input("Portes (S/)", 0.0, 100.0, 0.0, 0.5)
+
+        calcular = st.form_submit_button("🧮 Calcular mi crédito")
+
+    if calcular:
+        st.session_state["calculadora_activa"] = True
+    if not st.session_state.get("calculadora_activa"):
+        st.info("Configura los parámetros y pulsa **Calcular mi crédito**.")
+        return
+
+    valido, mensaje = _validar(monto, tea, plazo)
+    if not valido:
+        st.warning(mensaje)
+        return
+
+    # ------------------------------------------------------------------
+    # Cálculo
+    # ------------------------------------------------------------------
+    tabla, totales = _compute_amort(monto, tea, plazo, sistema)
+    tcea = _tcea_cached(
+        monto, round(tea, 8), plazo, costo_desembolso, costo_mensual,
+        seguro_desgravamen, portes,
+    )
+    comparacion = comparar_sistemas(monto, tea, plazo)
+    # Vista estructurada de la tabla: las lecturas puntuales y los loops
+    # acceden campos a nivel C en vez de pagar el indexer de pandas.
+    registros = tabla.to_records(index=False)
+    cuota_inicial = float(registros["cuota"][0])
+
+    ahorro = abs(
+        comparacion["frances"]["total_intereses"] - comparacion["aleman"]["total_intereses"]
+    )
+    # Las 8 métricas en un solo st.markdown: cada st.metric es un mensaje
+    # aparte por el protocolo de Streamlit, la grilla HTML cuesta uno.
+    metricas = [
+        ("Cuota inicial", formatear_moneda(cuota_inicial)),
+        ("TEA", f"{tea:.2f}%"),
+        ("TCEA estimada", f"{tcea:.2f}%" if tcea is not None else "—"),
+        ("Plazo", f"{plazo} meses"),
+        ("Total pagado", formatear_moneda(totales["total_pagado"])),
+        ("Total intereses", formatear_moneda(totales["total_intereses"])),
+        ("Diferencia francés/alemán", formatear_moneda(ahorro)),
+        (
+            "Promedio de mercado",
+            f"{promedio_mercado:.2f}%" if promedio_mercado else "—",
+        ),
+    ]
+    st.markdown(
+        '<div class="metric-grid">'
+        + "".join(
+            _METRIC_CARD_TMPL.format(label=label, value=value)
+            for label, value in metricas
+        )
+        + "</div>",
+        unsafe_allow_html=True,
+    )
+
+    costos = _compute_costs(
+        monto, plazo, costo_desembolso, costo_mensual, seguro_desgravamen,
+        portes, totales["total_pagado"],
+    )
+    if costos.adicionales > 0:
+        st.caption(
+            f"Costos adicionales estimados: {formatear_moneda(costos.adicionales)} — "
+            f"costo total del crédito: {formatear_moneda(costos.total)}"
+        )
+
+    tab_tabla, tab_graficos, tab_cronograma, tab_descargas = st.tabs(
+        ["📊 Tabla", "📈 Gráficos", "📅 Cronograma", "💾 Descargas"]
+    )
+
+    # ------------------------------------------------------------------
+    # Tab 1: tabla de amortización
+    # ------------------------------------------------------------------
+    with tab_tabla:
+        # column_config formatea en el cliente: el servidor manda floats
+        # crudos (payload menor, sin celdas HTML del Styler) y el widget
+        # conserva orden/filtrado numérico.
+        st.dataframe(
+            tabla,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "mes": st.column_config.NumberColumn("Mes"),
+                "saldo_inicial": st.column_config.NumberColumn(
+                    "Saldo inicial", format="S/ %.2f"
+                ),
+                "cuota": st.column_config.NumberColumn("Cuota", format="S/ %.2f"),
+                "interes": st.column_config.NumberColumn("Interés", format="S/ %.2f"),
+                "amortizacion": st.column_config.NumberColumn(
+                    "Amortización", format="S/ %.2f"
+                ),
+                "saldo_final": st.column_config.NumberColumn(
+                    "Saldo final", format="S/ %.2f"
+                ),
+            },
+        )
+
+        if tasas_mercado:
+            st.subheader("Tasas del mercado para este producto")
+            tasas_ordenadas = sorted(tasas_mercado.items(), key=lambda kv: kv[1])
+            # Una sola emisión: N llamadas a st.markdown son N mensajes por
+            # el websocket de Streamlit; unidas cuestan uno.
+            st.markdown(
+                "\n".join(
+                    _FILA_TASA_TMPL.format(banco=nombre, tasa=valor)
+                    for nombre, valor in tasas_ordenadas
+                ),
+                unsafe_allow_html=True,
+            )
+
+    # ------------------------------------------------------------------
+    # Tab 2: gráficos
+    # ------------------------------------------------------------------
+    with tab_graficos:
+        # Import diferido: plotly cuesta >500ms de import y solo se usa
+        # en esta pestaña; tras la primera vez lo sirve sys.modules.
+        import plotly.graph_objects as go
+
+        # Los buffers de cada columna se extraen una sola vez y se
+        # comparten por referencia entre todas las trazas: plotly acepta
+        # ndarrays directamente y se ahorra una conversión Serie→lista
+        # por traza (y con 360 cuotas, duplicar el eje x duplicaba el
+        # payload JSON).
+        x_mes = tabla["mes"].to_numpy()
+        y_interes = tabla["interes"].to_numpy()
+        y_amort = tabla["amortizacion"].to_numpy()
+        y_saldo = tabla["saldo_final"].to_numpy()
+
+        # Con plazos largos el render SVG de Scatter acumula nodos DOM;
+        # Scattergl dibuja por WebGL y mantiene fluido el navegador.
+        # Las barras no tienen variante gl y viajan como go.Bar siempre.
+        _Scatter = go.Scattergl if plazo >= 120 else go.Scatter
+
+        fig_comp = go.Figure()
+        fig_comp.add_trace(
+            go.Bar(
+                name="Interés", x=x_mes, y=y_interes,
+                marker={"color": "#c0392b"},
+            )
+        )
+        fig_comp.add_trace(
+            go.Bar(
+                name="Amortización", x=x_mes, y=y_amort,
+                marker={"color": "#1a5276"},
+            )
+        )
+        fig_comp.update_layout(
+            barmode="stack", title="Composición de la cuota por mes",
+            xaxis_title="Mes", yaxis_title="S/",
+        )
+        st.plotly_chart(fig_comp, use_container_width=True)
+
+        # Submuestreo para plazos largos (hipotecas a 360 meses): las
+        # barras viajan completas porque codifican cada cuota, pero las
+        # líneas con >_MAX_PUNTOS_LINEA puntos se reducen sin pérdida
+        # visual. Los acumulados se calculan antes de submuestrear.
+        idx_linea = _indices_muestra(len(tabla))
+        # np.cumsum sobre el buffer contiguo: sin construir Series ni
+        # Index intermedios, y el resultado va directo como y= sin
+        # columnas nuevas en el DataFrame.
+        interes_acum = np.cumsum(y_interes)
+        amort_acum = np.cumsum(y_amort)
+        x_linea = x_mes
+        if idx_linea is not None:
+            x_linea = x_mes[idx_linea]
+            y_saldo = y_saldo[idx_linea]
+            interes_acum = interes_acum[idx_linea]
+            amort_acum = amort_acum[idx_linea]
+
+        fig_saldo = go.Figure()
+        fig_saldo.add_trace(
+            _Scatter(
+                x=x_linea, y=y_saldo, mode="lines",
+                name="Saldo pendiente", fill="tozeroy", line={"color": "#1a5276"},
+            )
+        )
+        fig_saldo.update_layout(
+            title="Evolución del saldo", xaxis_title="Mes", yaxis_title="S/"
+        )
+        st.plotly_chart(fig_saldo, use_container_width=True)
+
+        fig_acum = go.Figure()
+        fig_acum.add_trace(
+            _Scatter(
+                x=x_linea, y=interes_acum, mode="lines",
+                name="Interés acumulado", line={"color": "#c0392b"},
+            )
+        )
+        fig_acum.add_trace(
+            _Scatter(
+                x=x_linea, y=amort_acum, mode="lines",
+                name="Capital acumulado", line={"color": "#1e8449"},
+            )
+        )
+        fig_acum.update_layout(
+            title="Pagos acumulados", xaxis_title="Mes", yaxis_title="S/"
+        )
+        st.plotly_chart(fig_acum, use_container_width=True)
+
+    # ------------------------------------------------------------------
+    # Tab 3: cronograma con fechas
+    # ------------------------------------------------------------------
+    with tab_cronograma:
+        hoy = datetime.now()
+        # pd.date_range genera todo el vector de fechas en C (sigue siendo
+        # aritmética de meses calendario); el loop Python construía y
+        # formateaba plazo datetimes uno a uno.
+        fechas = pd.date_range(
+            hoy + pd.DateOffset(months=1),
+            periods=len(tabla),
+            freq=pd.DateOffset(months=1),
+        ).strftime("%m/%Y")
+        st.caption(
+            f"Primer pago: {fechas[0]} — Último pago: {fechas[-1]}"
+        )
+        # Un solo st.dataframe en lugar de un st.markdown por cuota: el
+        # loop emitía plazo mensajes por el websocket; la tabla viaja en
+        # un delta y el formateo monetario lo hace el cliente.
+        cronograma = pd.DataFrame(
+            {
+                "mes": tabla["mes"],
+                "fecha_pago": fechas,
+                "cuota": tabla["cuota"],
+                "interes": tabla["interes"],
+                "saldo_final": tabla["saldo_final"],
+            }
+        )
+        st.dataframe(
+            cronograma,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "mes": st.column_config.NumberColumn("Mes"),
+                "fecha_pago": st.column_config.TextColumn("Fecha de pago"),
+                "cuota": st.column_config.NumberColumn("Cuota", format="S/ %.2f"),
+                "interes": st.column_config.NumberColumn("Interés", format="S/ %.2f"),
+                "saldo_final": st.column_config.NumberColumn(
+                    "Saldo final", format="S/ %.2f"
+                ),
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Tab 4: descargas
+    # ------------------------------------------------------------------
+    with tab_descargas:
+        st.download_button(
+            "⬇️ Descargar CSV", _csv_bytes(tabla),
+            file_name="opticred_cronograma.csv", mime="text/csv",
+        )
+
+        st.download_button(
+            "⬇️ Descargar Excel", _excel_bytes(tabla),
+            file_name="opticred_cronograma.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+        # ReportLab solo corre tras el clic: abrir la pestaña ya no paga
+        # la primera construcción del PDF (cientos de ms); las siguientes
+        # las resuelve el caché de pdf_generator.
+        if st.button("📄 Preparar PDF"):
+            st.session_state["pdf_listo"] = True
+        if st.session_state.get("pdf_listo"):
+            # Import diferido: pdf_generator arrastra reportlab (~200 ms
+            # de import); tras la primera vez lo resuelve sys.modules.
+            from modules.pdf_generator import generar_pdf_calculadora
+
+            pdf_buffer = generar_pdf_calculadora(
+                monto, tea, plazo, sistema, tabla, totales,
+                tcea=tcea, banco=banco, categoria=categoria, producto=producto,
+            )
+            st.download_button(
+                "⬇️ Descargar PDF", pdf_buffer,
+                file_name="opticred_simulacion.pdf", mime="application/pdf",
+            )
+            # El resumen solo lleva las primeras cuotas; para el detalle
+            # completo (hipotecas a 360 meses) va la variante de Canvas.
+            st.download_button(
+                "⬇️ Descargar cronograma completo (PDF)",
+                _pdf_cronograma_bytes(tabla),
+                file_name="opticred_cronograma_completo.pdf",
+                mime="application/pdf",
+            )
+
+        st.subheader("Resumen para copiar")
+        st.code(
+            _resumen_texto(
+                categoria, producto, banco, tea, tcea, monto, plazo, sistema,
+                cuota_inicial, totales["total_pagado"], totales["total_intereses"],
+            ),
+            language=None,
+        )
@@ -0,0 +1,335 @@
+"""Generación de reportes PDF de la calculadora de créditos (ReportLab)."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+
+import pandas as pd
+import streamlit as st
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from modules.amortizacion import formatear_moneda
+
+# Meses incluidos en el extracto del cronograma dentro del PDF.
+_FILAS_PDF = 12
+
+# Estilos construidos una sola vez al importar: son deterministas y
+# reutilizables entre documentos, así cada PDF se ahorra la asignación de
+# ~11 objetos de estilo por llamada.
+_ESTILOS = getSampleStyleSheet()
+_TITULO_STYLE = ParagraphStyle(
+    "TituloOptiCred",
+    parent=_ESTILOS["Title"],
+    fontSize=18,
+    textColor=colors.HexColor("#1a5276"),
+    spaceAfter=6,
+)
+_SUBTITULO_STYLE = ParagraphStyle(
+    "SubtituloOptiCred",
+    parent=_ESTILOS["Normal"],
+    fontSize=10,
+    textColor=colors.grey,
+    spaceAfter=12,
+)
+_SECCION_STYLE = ParagraphStyle(
+    "SeccionOptiCred",
+    parent=_ESTILOS["Heading2"],
+    fontSize=13,
+    textColor=colors.HexColor("#1a5276"),
+    spaceBefore=10,
+    spaceAfter=6,
+)
+_NOTA_STYLE = ParagraphStyle(
+    "NotaOptiCred",
+    parent=_ESTILOS["Normal"],
+    fontSize=8,
+    textColor=colors.grey,
+)
+
+_DATOS_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#eaf2f8")),
+        ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#1b2631")),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#aed6f1")),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+    ]
+)
+_RESUMEN_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1a5276")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("ALIGN", (1, 0), (-1, -1), "RIGHT"),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#aed6f1")),
+    ]
+)
+_AMORT_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1a5276")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#aed6f1")),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f4f9fc")]),
+    ]
+)
+
+
+def _dibujar_tabla_canvas(c, data, x0, y0, col_widths, row_h=0.5 * cm):
+    """Dibuja filas de tabla directamente sobre un Canvas, sin platypus.
+
+    Para cronogramas largos el motor de layout de flowables domina el
+    tiempo de generación; con coordenadas precalculadas cada celda es un
+    drawString y cada borde un line. Devuelve la coordenada y final.
+    """
+    y = y0
+    for fila in data:
+        x = x0
+        for valor, ancho in zip(fila, col_widths):
+            c.drawRightString(x + ancho - 4, y - row_h + 4, str(valor))
+            x += ancho
+        c.line(x0, y - row_h, x0 + sum(col_widths), y - row_h)
+        y -= row_h
+    return y
+
+
+def generar_pdf_cronograma_completo(tabla: pd.DataFrame) -> io.BytesIO:
+    """Cronograma completo (todas las filas) dibujado con Canvas crudo.
+
+    Variante para plazos largos: evita el layout O(n²) de platypus
+    paginando a mano ~45 filas por página A4.
+    """
+    from reportlab.pdfgen.canvas import Canvas
+
+    buffer = io.BytesIO()
+    c = Canvas(buffer, pagesize=A4, pageCompression=1)
+    ancho_pagina, alto_pagina = A4
+    col_widths = [1.5 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm]
+    x0 = (ancho_pagina - sum(col_widths)) / 2
+    encabezado = ["Mes", "Saldo inicial", "Cuota", "Interés", "Amortización", "Saldo final"]
+    filas = [
+        [str(int(r[0]))] + [f"{v:,.2f}" for v in r[1:]]
+        for r in tabla[
+            ["mes", "saldo_inicial", "cuota", "interes", "amortizacion", "saldo_final"]
+        ].to_numpy()
+    ]
+
+    filas_por_pagina = 45
+    for inicio in range(0, len(filas), filas_por_pagina):
+        y = alto_pagina - 2 * cm
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(x0, y, "OptiCred — Cronograma de pagos")
+        y -= 0.8 * cm
+        c.setFont("Helvetica-Bold", 8)
+        y = _dibujar_tabla_canvas(c, [encabezado], x0, y, col_widths)
+        c.setFont("Helvetica", 8)
+        _dibujar_tabla_canvas(
+            c, filas[inicio : inicio + filas_por_pagina], x0, y, col_widths
+        )
+        c.showPage()
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+def _chunked_table(data, header, style, col_widths, chunk=200):
+    """Parte una tabla larga en varios flowables Table secuenciales.
+
+    El layout de Table en ReportLab es cuadrático en el número de filas;
+    con trozos de ~200 filas el costo baja a O(n·k) y cada trozo repite
+    el encabezado. Para tablas cortas devuelve un único Table.
+    """
+    flowables = []
+    for inicio in range(0, len(data), chunk):
+        if flowables:
+            flowables.append(Spacer(1, 0.1 * cm))
+        flowables.append(
+            Table(
+                [header] + data[inicio : inicio + chunk],
+                colWidths=col_widths,
+                style=style,
+                repeatRows=1,
+            )
+        )
+    return flowables
+
+
+def generar_pdf_calculadora(
+    monto: float,
+    tea: float,
+    plazo: int,
+    sistema: str,
+    tabla: pd.DataFrame,
+    totales: Dict[str, float],
+    tcea: Optional[float] = None,
+    banco: Optional[str] = None,
+    categoria: Optional[str] = None,
+    producto: Optional[str] = None,
+) -> io.BytesIO:
+    """Arma el reporte PDF del crédito simulado.
+
+    Devuelve un `BytesIO` listo para `st.download_button`. El armado real
+    está memoizado: clics repetidos con los mismos parámetros devuelven
+    los bytes cacheados sin volver a pagar el layout de platypus, que es
+    el costo dominante de ReportLab.
+    """
+    datos = _build_pdf_bytes(
+        monto, tea, plazo, sistema, tabla, totales, tcea, banco, categoria, producto
+    )
+    return io.BytesIO(datos)
+
+
+@st.cache_data(
+    max_entries=32,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d).values.tobytes()},
+)
+def _build_pdf_bytes(
+    monto: float,
+    tea: float,
+    plazo: int,
+    sistema: str,
+    tabla: pd.DataFrame,
+    totales: Dict[str, float],
+    tcea: Optional[float],
+    banco: Optional[str],
+    categoria: Optional[str],
+    producto: Optional[str],
+) -> bytes:
+    """Cuerpo del reporte; cacheado por combinación exacta de entradas."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        topMargin=1.5 * cm,
+        bottomMargin=1.5 * cm,
+        leftMargin=2 * cm,
+        rightMargin=2 * cm,
+        title="OptiCred - Simulación de crédito",
+        pageCompression=1,
+    )
+
+    # Las tres secciones son independientes: sus flowables se arman en
+    # paralelo (el wrapping de Paragraph y las métricas de fuentes de
+    # ReportLab se solapan) y se concatenan en orden al final.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        fut_datos = pool.submit(
+            _seccion_datos, monto, tea, plazo, sistema, tcea, banco, categoria, producto
+        )
+        fut_resumen = pool.submit(_seccion_resumen, totales)
+        fut_amort = pool.submit(_seccion_cronograma, tabla)
+        elementos = [
+            Paragraph("OptiCred — Simulación de crédito", _TITULO_STYLE),
+            Paragraph(
+                f"Generado el {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+                _SUBTITULO_STYLE,
+            ),
+        ]
+        elementos.extend(fut_datos.result())
+        elementos.extend(fut_resumen.result())
+        elementos.extend(fut_amort.result())
+
+    elementos.append(Spacer(1, 0.4 * cm))
+    elementos.append(
+        Paragraph(
+            "Simulación referencial generada con tasas publicadas por la SBS; "
+            "las condiciones finales dependen de la evaluación de cada entidad.",
+            _NOTA_STYLE,
+        )
+    )
+
+    doc.build(elementos)
+    return buffer.getvalue()
+
+
+def _seccion_datos(
+    monto: float,
+    tea: float,
+    plazo: int,
+    sistema: str,
+    tcea: Optional[float],
+    banco: Optional[str],
+    categoria: Optional[str],
+    producto: Optional[str],
+) -> list:
+    """Flowables de la sección "Datos del crédito"."""
+    datos_credito = [
+        ["Monto del crédito", formatear_moneda(monto)],
+        ["TEA", f"{tea:.2f}%"],
+        ["Plazo", f"{plazo} meses"],
+        ["Sistema de amortización", sistema.capitalize()],
+    ]
+    if banco:
+        datos_credito.append(["Banco de referencia", banco])
+    if categoria and producto:
+        datos_credito.append(["Producto", f"{categoria} - {producto}"])
+    if tcea is not None:
+        datos_credito.append(["TCEA estimada", f"{tcea:.2f}%"])
+    return [
+        Paragraph("Datos del crédito", _SECCION_STYLE),
+        Table(datos_credito, colWidths=[7 * cm, 7 * cm], style=_DATOS_TABLE_STYLE),
+    ]
+
+
+def _seccion_resumen(totales: Dict[str, float]) -> list:
+    """Flowables de la sección "Resumen del financiamiento"."""
+    resumen = [
+        ["Concepto", "Monto"],
+        ["Total pagado", formatear_moneda(totales["total_pagado"])],
+        ["Total intereses", formatear_moneda(totales["total_intereses"])],
+        ["Total amortizado", formatear_moneda(totales["total_amortizado"])],
+    ]
+    return [
+        Paragraph("Resumen del financiamiento", _SECCION_STYLE),
+        Table(resumen, colWidths=[7 * cm, 7 * cm], style=_RESUMEN_TABLE_STYLE),
+    ]
+
+
+def _seccion_cronograma(tabla: pd.DataFrame) -> list:
+    """Flowables del extracto del cronograma (primeros meses)."""
+    filas_mostrar = min(_FILAS_PDF, len(tabla))
+    encabezado = ["Mes", "Saldo inicial", "Cuota", "Interés", "Amortización", "Saldo final"]
+    # Un solo slice C-level a ndarray en lugar de filas_mostrar accesos
+    # iloc que materializan una Series (con boxing) por fila.
+    sub = tabla.iloc[:filas_mostrar][
+        ["mes", "saldo_inicial", "cuota", "interes", "amortizacion", "saldo_final"]
+    ].to_numpy()
+    tabla_amort_data = [
+        [
+            str(int(r[0])),
+            f"S/ {r[1]:,.2f}",
+            f"S/ {r[2]:,.2f}",
+            f"S/ {r[3]:,.2f}",
+            f"S/ {r[4]:,.2f}",
+            f"S/ {r[5]:,.2f}",
+        ]
+        for r in sub
+    ]
+    elementos = [Paragraph("Cronograma de pagos (primeros meses)", _SECCION_STYLE)]
+    elementos.extend(
+        _chunked_table(
+            tabla_amort_data,
+            encabezado,
+            _AMORT_TABLE_STYLE,
+            [1.5 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm, 2.9 * cm],
+        )
+    )
+    if len(tabla) > filas_mostrar:
+        elementos.append(Spacer(1, 0.2 * cm))
+        elementos.append(
+            Paragraph(
+                f"Se muestran los primeros {filas_mostrar} de {len(tabla)} meses. "
+                "El cronograma completo está disponible en la exportación CSV/Excel.",
+                _NOTA_STYLE,
+            )
+        )
+    return elementos
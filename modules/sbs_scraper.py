@@ -0,0 +1,189 @@
+"""Scraper de tasas activas de la SBS (Superintendencia de Banca y Seguros).
+
+Obtiene la tabla de tasas de interés promedio publicada por la SBS usando
+Playwright (la página arma la tabla con JavaScript) y la expone como
+DataFrame de pandas.
+"""
+
+import logging
+from enum import Enum
+from io import StringIO
+from typing import List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SBS_URL = (
+    "https://www.sbs.gob.pe/app/pp/EstadisticasSAEEPortal/Paginas/"
+    "TIActivaTipoCreditoEmpresa.aspx?tip=B"
+)
+
+
+class Slice_Tipo_Credito(Enum):
+    """Secciones (categorías principales) de la tabla de la SBS."""
+
+    CORPORATIVOS = "Corporativos"
+    GRANDES_EMPRESAS = "Grandes Empresas"
+    MEDIANAS_EMPRESAS = "Medianas Empresas"
+    PEQUENAS_EMPRESAS = "Pequeñas Empresas"
+    MICROEMPRESAS = "Microempresas"
+    CONSUMO = "Consumo"
+    HIPOTECARIOS = "Hipotecarios"
+
+
+class Columna_Banco(Enum):
+    """Columnas de bancos tal como aparecen en la tabla de la SBS."""
+
+    BCP = "BCP"
+    BBVA = "BBVA"
+    INTERBANK = "Interbank"
+    SCOTIABANK = "Scotiabank"
+    BANBIF = "BanBif"
+    PICHINCHA = "Pichincha"
+    MIBANCO = "Mibanco"
+    GNB = "GNB"
+    FALABELLA = "Falabella"
+    RIPLEY = "Ripley"
+    SANTANDER = "Santander"
+    CITIBANK = "Citibank"
+    COMERCIO = "Comercio"
+
+
+class Corporativos(Enum):
+    DESCUENTOS = "Descuentos"
+    PRESTAMOS_HASTA_30_DIAS = "Préstamos hasta 30 días"
+    PRESTAMOS_A_MAS_DE_360_DIAS = "Préstamos a más de 360 días"
+
+
+class Grandes_Empresas(Enum):
+    DESCUENTOS = "Descuentos"
+    PRESTAMOS_HASTA_30_DIAS = "Préstamos hasta 30 días"
+    PRESTAMOS_A_MAS_DE_360_DIAS = "Préstamos a más de 360 días"
+
+
+class Medianas_Empresas(Enum):
+    DESCUENTOS = "Descuentos"
+    PRESTAMOS_HASTA_30_DIAS = "Préstamos hasta 30 días"
+    PRESTAMOS_A_MAS_DE_360_DIAS = "Préstamos a más de 360 días"
+
+
+class Pequenas_Empresas(Enum):
+    PRESTAMOS_HASTA_30_DIAS = "Préstamos hasta 30 días"
+    PRESTAMOS_A_MAS_DE_360_DIAS = "Préstamos a más de 360 días"
+
+
+class Microempresas(Enum):
+    TARJETAS_DE_CREDITO = "Tarjetas de Crédito"
+    PRESTAMOS_A_MAS_DE_360_DIAS = "Préstamos a más de 360 días"
+
+
+class Consumo(Enum):
+    TARJETAS_DE_CREDITO = "Tarjetas de Crédito"
+    PRESTAMOS_NO_REVOLVENTES = "Préstamos no Revolventes"
+    PRESTAMOS_VEHICULARES = "Préstamos Vehiculares"
+
+
+class Hipotecarios(Enum):
+    PRESTAMOS_HIPOTECARIOS = "Préstamos hipotecarios para vivienda"
+
+
+# Clases de crédito en el mismo orden en que aparecen en la tabla.
+opciones = [
+    Corporativos,
+    Grandes_Empresas,
+    Medianas_Empresas,
+    Pequenas_Empresas,
+    Microempresas,
+    Consumo,
+    Hipotecarios,
+]
+
+# Columnas que no corresponden a bancos.
+COLUMNAS_NO_BANCO = {"", "tipo", "producto", "promedio"}
+
+
+class SBSScraper:
+    """Extrae la tabla de tasas activas desde el portal de la SBS."""
+
+    def __init__(self, url: str = SBS_URL):
+        self.url = url
+
+    async def _fetch_html(self) -> str:
+        """Carga la página con Playwright y devuelve el HTML renderizado."""
+        # Import diferido: quien importa este módulo por los enums (el
+        # servidor de la API, los tests) no debe pagar la carga de
+        # Playwright; solo se importa al hacer un scrape real.
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                page = await browser.new_page()
+                await page.goto(self.url, wait_until="networkidle")
+                return await page.content()
+            finally:
+                await browser.close()
+
+    async def get_tasas_activas(self) -> pd.DataFrame:
+        """Devuelve la tabla completa de tasas activas (filas = productos)."""
+        html = await self._fetch_html()
+        tablas = pd.read_html(StringIO(html), decimal=",", thousands=".")
+        if not tablas:
+            raise ValueError("No se encontró la tabla de tasas en la página de la SBS")
+        tasas = tablas[0]
+        tasas = tasas.set_index(tasas.columns[0])
+        logger.info("Tabla de tasas SBS cargada: %d filas", len(tasas))
+        return tasas
+
+    async def get_bancos(self) -> List[str]:
+        """Lista de bancos presentes como columnas en la tabla."""
+        tasas = await self.get_tasas_activas()
+        return [
+            str(col)
+            for col in tasas.columns
+            if str(col).strip().lower() not in COLUMNAS_NO_BANCO
+        ]
+
+    async def get_tasas_por_tipo(self, slice_tipo: Slice_Tipo_Credito) -> pd.DataFrame:
+        """Sub-tabla de una categoría principal (Consumo, Hipotecarios, ...)."""
+        tasas = await self.get_tasas_activas()
+        indices = [str(i).strip() for i in tasas.index]
+        try:
+            inicio = indices.index(slice_tipo.value)
+        except ValueError:
+            raise ValueError(f"Categoría no encontrada en la tabla: {slice_tipo.value}")
+        fin = len(indices)
+        for i in range(inicio + 1, len(indices)):
+            if indices[i] in {s.value for s in Slice_Tipo_Credito}:
+                fin = i
+                break
+        return tasas.iloc[inicio:fin]
+
+    async def get_tea(self, banco: Columna_Banco, credito: Enum) -> Optional[float]:
+        """TEA de un banco para un producto de crédito específico."""
+        tasas = await self.get_tasas_activas()
+        for idx in tasas.index:
+            if str(idx).strip().lower() == credito.value.strip().lower():
+                try:
+                    valor = float(tasas.loc[idx, banco.value])
+                except (KeyError, TypeError, ValueError):
+                    return None
+                return valor if valor > 0 else None
+        return None
+
+    async def get_promedio(self, credito: Enum) -> Optional[float]:
+        """Tasa promedio del mercado para un producto de crédito."""
+        tasas = await self.get_tasas_activas()
+        promedio_col = next(
+            (c for c in tasas.columns if "promedio" in str(c).strip().lower()), None
+        )
+        if promedio_col is None:
+            return None
+        for idx in tasas.index:
+            if str(idx).strip().lower() == credito.value.strip().lower():
+                try:
+                    return float(tasas.loc[idx, promedio_col])
+                except (TypeError, ValueError):
+                    return None
+        return None
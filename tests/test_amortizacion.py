@@ -0,0 +1,26 @@
+"""Tests de los cálculos financieros de OptiCred."""
+
+import pytest
+
+from modules.amortizacion import calcular_tcea_completa, generar_tabla_francesa
+
+
+def test_tcea_sin_costos_coincide_con_la_tea():
+    """Sin costos adicionales la TCEA debe ser la TEA (la bisección de la
+    TIR tiene que converger a la tasa del crédito, no divergir)."""
+    tcea = calcular_tcea_completa(20000, 15.0, 24)
+    # La cuota viaja redondeada a céntimos, de ahí la tolerancia.
+    assert tcea == pytest.approx(15.0, abs=0.01)
+
+
+def test_tcea_con_costos_supera_la_tea():
+    tcea = calcular_tcea_completa(20000, 15.0, 24, costo_desembolso=1.0, costo_mensual=10.0)
+    assert tcea > 15.0
+    assert tcea < 30.0  # orden de magnitud razonable, no una tasa absurda
+
+
+def test_tabla_francesa_amortiza_todo_el_monto():
+    tabla = generar_tabla_francesa(20000, 15.0, 24)
+    assert len(tabla) == 24
+    assert tabla["amortizacion"].sum() == pytest.approx(20000, abs=1.0)
+    assert tabla["saldo_final"].iloc[-1] == pytest.approx(0.0, abs=0.01)
@@ -0,0 +1,62 @@
+"""Tests del cliente HTTP de OptiCred."""
+
+import asyncio
+
+import pandas as pd
+
+from api import api_client
+
+
+def test_get_promedio_llama_al_endpoint_correcto(monkeypatch):
+    """La función de conveniencia debe delegar en /tasas/promedio/...,
+    no re-descargar la tabla completa de /tasas/activas."""
+    llamadas = []
+
+    async def fake_make_request(self, endpoint, params=None):
+        llamadas.append(endpoint)
+        return 12.34
+
+    monkeypatch.setattr(
+        api_client.OptiCredAPIClient, "_make_request", fake_make_request
+    )
+    resultado = asyncio.run(api_client.get_promedio("consumo", "tarjetas_de_credito"))
+
+    assert resultado == 12.34
+    assert llamadas == ["/tasas/promedio/consumo/tarjetas_de_credito"]
+
+
+def test_get_tasas_por_tipo_devuelve_dataframe(monkeypatch):
+    """/tasas/tipo/{t} responde el dict orient='split' bidimensional de
+    _split_payload: el cliente debe armar un DataFrame con los bancos
+    como columnas, no una Series de listas."""
+
+    async def fake_make_request(self, endpoint, params=None):
+        assert endpoint == "/tasas/tipo/consumo"
+        return {
+            "columns": ["BCP", "BBVA"],
+            "index": ["Tarjetas de Crédito", "Préstamos Vehiculares"],
+            "data": [[45.0, 42.5], [12.1, 13.9]],
+        }
+
+    monkeypatch.setattr(
+        api_client.OptiCredAPIClient, "_make_request", fake_make_request
+    )
+    cliente = api_client.OptiCredAPIClient()
+    tasas = asyncio.run(cliente.get_tasas_por_tipo("consumo"))
+
+    assert isinstance(tasas, pd.DataFrame)
+    assert list(tasas.columns) == ["BCP", "BBVA"]
+    assert tasas.loc["Préstamos Vehiculares", "BBVA"] == 13.9
+
+
+def test_json_to_dataframe_construye_desde_dict_split():
+    cliente = api_client.OptiCredAPIClient()
+    datos = {
+        "columns": ["BCP", "BBVA"],
+        "index": ["Tarjetas de Crédito"],
+        "data": [[45.0, 42.5]],
+    }
+    df = cliente._json_to_dataframe(datos)
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ["BCP", "BBVA"]
+    assert df.loc["Tarjetas de Crédito", "BCP"] == 45.0
@@ -0,0 +1,83 @@
+"""Tests de los endpoints del servidor de la API."""
+
+import asyncio
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from api import api_server
+
+
+class _ScraperStub:
+    """Scraper falso: sirve una tabla fija sin tocar Playwright."""
+
+    def __init__(self, tasas: pd.DataFrame):
+        self._tasas = tasas
+
+    async def get_tasas_activas(self) -> pd.DataFrame:
+        return self._tasas
+
+
+def _cliente_con_tabla(monkeypatch, tasas: pd.DataFrame) -> TestClient:
+    api_server.cache.clear()
+    monkeypatch.setattr(api_server, "get_scraper", lambda: _ScraperStub(tasas))
+    return TestClient(api_server.app)
+
+
+def test_tasas_activas_serializa_el_ndarray(monkeypatch):
+    """El payload orient='split' lleva un ndarray en "data"; la ruta debe
+    devolver ORJSONResponse directamente o FastAPI responde 500. Con dos
+    o más filas el ndarray es la vista F-contigua del block manager, que
+    orjson rechaza sin la copia compacta."""
+    tasas = pd.DataFrame(
+        [[45.0, 42.5], [12.1, 13.9]],
+        columns=["BCP", "BBVA"],
+        index=["Tarjetas de Crédito", "Préstamos Vehiculares"],
+    )
+    cliente = _cliente_con_tabla(monkeypatch, tasas)
+
+    respuesta = cliente.get("/tasas/activas")
+
+    assert respuesta.status_code == 200
+    cuerpo = respuesta.json()
+    assert cuerpo["columns"] == ["BCP", "BBVA"]
+    assert cuerpo["index"] == ["Tarjetas de Crédito", "Préstamos Vehiculares"]
+    assert cuerpo["data"] == [[45.0, 42.5], [12.1, 13.9]]
+
+
+def test_tasas_activas_serializa_celdas_de_texto(monkeypatch):
+    """La tabla scrapeada trae huecos "-" (dtype object): el payload debe
+    degradar a listas en lugar de fallar con el ndarray de objetos."""
+    tasas = pd.DataFrame(
+        [[45.0, "-"], ["-", 13.9]],
+        columns=["BCP", "BBVA"],
+        index=["Tarjetas de Crédito", "Préstamos Vehiculares"],
+    )
+    cliente = _cliente_con_tabla(monkeypatch, tasas)
+
+    respuesta = cliente.get("/tasas/activas")
+
+    assert respuesta.status_code == 200
+    assert respuesta.json()["data"] == [[45.0, "-"], ["-", 13.9]]
+
+
+def test_cached_memoriza_resultados_none():
+    """None es un resultado legítimo del scraper (banco sin tasa
+    publicada) y debe cachearse durante el TTL: la segunda petición no
+    puede relanzar el scrape."""
+    api_server.cache.clear()
+    llamadas = []
+
+    async def factory():
+        llamadas.append(1)
+        return None
+
+    async def consultar_dos_veces():
+        primero = await api_server.cached("tea:prueba", factory)
+        segundo = await api_server.cached("tea:prueba", factory)
+        return primero, segundo
+
+    primero, segundo = asyncio.run(consultar_dos_veces())
+
+    assert primero is None and segundo is None
+    assert llamadas == [1]